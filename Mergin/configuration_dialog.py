@@ -1,9 +1,9 @@
 import os
 from qgis.PyQt.QtWidgets import QDialog, QApplication, QDialogButtonBox, QMessageBox
 from qgis.PyQt import uic
-from qgis.PyQt.QtCore import Qt, QSettings
+from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtGui import QPixmap
-from qgis.core import QgsApplication, QgsExpressionContextUtils
+from qgis.core import QgsApplication
 from urllib.error import URLError
 
 try:
@@ -26,6 +26,11 @@ from .utils import (
     test_server_connection,
     mm_logo_path,
     is_dark_theme,
+    mergin_settings,
+    message_log,
+    SERVER_SETTINGS_KEY,
+    set_global_variables,
+    clear_shared_mergin_clients,
 )
 
 ui_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "ui_config.ui")
@@ -35,7 +40,7 @@ class ConfigurationDialog(QDialog):
     def __init__(self):
         QDialog.__init__(self)
         self.ui = uic.loadUi(ui_file, self)
-        settings = QSettings()
+        settings = mergin_settings()
         if is_dark_theme():
             self.ui.label.setText(
                 "Don't have an account yet? <a style='color:#88b2f5' href='https://app.merginmaps.com/register'>Sign up</a> now!"
@@ -98,8 +103,9 @@ class ConfigurationDialog(QDialog):
         url = self.server_url()
         username = self.ui.username.text()
         password = self.ui.password.text()
-        settings = QSettings()
+        settings = mergin_settings()
         settings.setValue("Mergin/auth_token", None)  # reset token
+        clear_shared_mergin_clients()
         settings.setValue("Mergin/saveCredentials", str(self.ui.save_credentials.isChecked()))
         settings.setValue("Mergin/username", username)
 
@@ -114,16 +120,15 @@ class ConfigurationDialog(QDialog):
                 proxy_config = get_qgis_proxy_config(url)
                 mc = MerginClient(url, None, username, password, get_plugin_version(), proxy_config)
                 settings.setValue("Mergin/auth_token", mc._auth_session["token"])
-                settings.setValue("Mergin/server", url)
+                settings.setValue(SERVER_SETTINGS_KEY, url)
             except (URLError, ClientError, LoginError) as e:
-                QgsApplication.messageLog().logMessage(f"Mergin Maps plugin: {str(e)}")
+                message_log().logMessage(f"Mergin Maps plugin: {str(e)}")
                 mc = None
 
-        QgsExpressionContextUtils.setGlobalVariable("mergin_url", url)
         if mc:
-            QgsExpressionContextUtils.setGlobalVariable("mergin_username", username)
+            set_global_variables({"mergin_url": url, "mergin_username": username})
         else:
-            QgsExpressionContextUtils.removeGlobalVariable("mergin_username")
+            set_global_variables({"mergin_url": url}, remove=("mergin_username",))
 
         return mc
 
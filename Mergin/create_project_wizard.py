@@ -538,9 +538,9 @@ class NewMerginProjectWizard(QWizard):
             self.project_manager.open_project(self.project_dir)
 
         if failed_packaging:
-            warn = "Failed to package following layers:\n"
-            for layer, reason in failed_packaging:
-                warn += f"\n  * {layer} - {reason}"
+            warn = "Failed to package following layers:\n" + "".join(
+                f"\n  * {layer} - {reason}" for layer, reason in failed_packaging
+            )
             QMessageBox.warning(None, "Error Packaging Layers", warn)
 
     def cancel_wizard(self):
@@ -3,6 +3,13 @@ import json
 import base64
 import sqlite3
 import tempfile
+from itertools import islice
+
+try:
+    # faster parser for large changesets, not bundled with QGIS so it is used only if available
+    import orjson
+except ImportError:
+    orjson = None
 
 from qgis.PyQt.QtCore import QVariant
 
@@ -14,8 +21,6 @@ from qgis.core import (
     QgsGeometry,
     QgsFields,
     QgsField,
-    QgsProject,
-    QgsLayerTreeLayer,
     QgsConditionalStyle,
     QgsSymbolLayerUtils,
     QgsMarkerSymbol,
@@ -29,6 +34,14 @@ from .utils import pygeodiff, get_schema
 
 diff_layers_list = []
 
+# number of diff features passed to a feature sink at once
+FEATURES_BATCH_SIZE = 1000
+# number of parameters bound to a single SQLite query, older SQLite versions allow at most 999
+SQLITE_MAX_PARAMS = 500
+# size of the memory map (256 MB) and page cache (128 MB, negative value is in KiB) for reading GPKG rows
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+SQLITE_CACHE_SIZE = -128 * 1024
+
 
 class ColumnSchema:
     """Describes GPKG table column"""
@@ -83,6 +96,47 @@ def get_row_from_db(db_conn, schema_table, entry_changes):
     return c.fetchone()
 
 
+def get_rows_from_db(db_conn, schema_table, entries_changes):
+    """
+    Fetches rows from DB's table for multiple changeset entries with as few queries as possible.
+    Returns list of rows in the same order as the entries, None for rows which do not exist.
+    Tables with composite primary key are queried row by row using get_row_from_db().
+    """
+    pkey_indexes = [i for i, col in enumerate(schema_table.columns) if col.pkey]
+    if len(pkey_indexes) != 1:
+        return [get_row_from_db(db_conn, schema_table, entry_changes) for entry_changes in entries_changes]
+
+    pkey_index = pkey_indexes[0]
+    keys = [old_value_for_column_by_index(entry_changes, pkey_index) for entry_changes in entries_changes]
+
+    rows = {}
+    c = db_conn.cursor()
+    for start in range(0, len(keys), SQLITE_MAX_PARAMS):
+        chunk = keys[start : start + SQLITE_MAX_PARAMS]
+        c.execute(
+            'SELECT * FROM "{}" WHERE "{}" IN ({})'.format(
+                schema_table.name, schema_table.columns[pkey_index].name, ", ".join("?" * len(chunk))
+            ),
+            chunk,
+        )
+        for row in c:
+            rows[row[pkey_index]] = row
+    return [rows.get(key) for key in keys]
+
+
+def connect_db_for_reading(db_file):
+    """
+    Opens connection to the GPKG which is only used for reading the rows referenced by the diff.
+    Pages are read through the memory map and kept in a larger cache, as rows are fetched in random order.
+    """
+    db_conn = sqlite3.connect(db_file)
+    db_conn.execute("PRAGMA query_only = ON")
+    db_conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+    db_conn.execute(f"PRAGMA cache_size = {SQLITE_CACHE_SIZE}")
+    db_conn.execute("PRAGMA temp_store = MEMORY")
+    return db_conn
+
+
 def parse_gpkg_geom_encoding(wkb_with_gpkg_hdr):
     """Parse header of GPKG WKB and return WKB geometry"""
     flag_byte = wkb_with_gpkg_hdr[3]
@@ -118,8 +172,12 @@ def parse_diff(geodiff, diff_file):
     tmp_file.close()
 
     geodiff.list_changes(diff_file, tmp_file.name)
-    with open(tmp_file.name, encoding="utf-8") as f:
-        diff_json = json.load(f)
+    if orjson is not None:
+        with open(tmp_file.name, "rb") as f:
+            diff_json = orjson.loads(f.read())
+    else:
+        with open(tmp_file.name, encoding="utf-8") as f:
+            diff_json = json.load(f)
     os.unlink(tmp_file.name)
 
     diff_entries = diff_json["geodiff"]
@@ -127,13 +185,7 @@ def parse_diff(geodiff, diff_file):
     # group diff entries by tables
     diff_tables = {}  # key: table name, value: list of tuples (type, changes)
     for diff_entry in diff_entries:
-        entry_table = diff_entry["table"]
-        entry_type = diff_entry["type"]
-        entry_changes = diff_entry["changes"]
-
-        if entry_table not in diff_tables:
-            diff_tables[entry_table] = []
-        diff_tables[entry_table].append((entry_type, entry_changes))
+        diff_tables.setdefault(diff_entry["table"], []).append((diff_entry["type"], diff_entry["changes"]))
 
     return diff_tables
 
@@ -181,66 +233,80 @@ def create_field_list(schema_table):
 
 def diff_table_to_features(diff_table, schema_table, fields, cols_to_flds, db_conn=None):
     """
-    Converts a diff into list of QgsFeatures.
+    Converts a diff into QgsFeatures. This is a generator, features are created one by one
+    as they are consumed, so the whole diff does not need to be held in memory as features.
 
     Input is list of tuples (type, changes) where type is 'insert'/'update'/'delete'
     and changes is a list of dicts. Each dict with 'column', 'old', 'new' (old/new optional)
     """
-    column_names = [column.name for column in schema_table.columns]
-    features = []
-
     fld_geometry_idx = fields.indexOf("geometry")
     fld_old_offset = fld_geometry_idx + 1
+    fld_op_idx = fields.indexOf("_op")
 
     geom_col_index = schema_table.geometry_column_index()
 
-    for entry_type, entry_changes in diff_table:
-        f = QgsFeature(fields)
-        row = [None for i in range(len(column_names))]
-
-        f["_op"] = entry_type
-
-        # try to fill in unchanged columns from the database
-        if entry_type == "update" and db_conn is not None:
-            db_row = get_row_from_db(db_conn, schema_table, entry_changes)
+    for start in range(0, len(diff_table), FEATURES_BATCH_SIZE):
+        entries = diff_table[start : start + FEATURES_BATCH_SIZE]
+
+        # rows with unchanged columns of updated features are fetched from the database for the whole batch at once
+        db_rows = iter(())
+        if db_conn is not None:
+            updates = [entry_changes for entry_type, entry_changes in entries if entry_type == "update"]
+            db_rows = iter(get_rows_from_db(db_conn, schema_table, updates))
+
+        for entry_type, entry_changes in entries:
+            f = QgsFeature(fields)
+            f[fld_op_idx] = entry_type
+
+            # try to fill in unchanged columns from the database
+            if entry_type == "update" and db_conn is not None:
+                db_row = next(db_rows)
+
+                for i in range(len(db_row) if db_row is not None else 0):
+                    if i == geom_col_index:
+                        wkb = parse_gpkg_geom_encoding(db_row[i])
+                        g = QgsGeometry()
+                        g.fromWkb(wkb)
+                        f.setGeometry(g)
+
+                        wkt = g.asWkt()
+                        f[fld_geometry_idx] = wkt
+                        f[fld_geometry_idx + fld_old_offset] = wkt
+                    else:
+                        fld_idx = cols_to_flds[i]
+                        f[fld_idx] = db_row[i]
+                        f[fld_idx + fld_old_offset] = db_row[i]
+
+            for entry_change in entry_changes:
+                i = entry_change["column"]
+                if "new" in entry_change:
+                    value = entry_change["new"]
+                elif "old" in entry_change:
+                    value = entry_change["old"]
+                else:
+                    value = "?"
 
-            for i in range(len(db_row)):
                 if i == geom_col_index:
-                    wkb = parse_gpkg_geom_encoding(db_row[i])
+                    wkb_with_gpkg_hdr = base64.decodebytes(value.encode("ascii"))
+                    wkb = parse_gpkg_geom_encoding(wkb_with_gpkg_hdr)
                     g = QgsGeometry()
                     g.fromWkb(wkb)
                     f.setGeometry(g)
 
                     f[fld_geometry_idx] = g.asWkt()
-                    f[fld_geometry_idx + fld_old_offset] = g.asWkt()
-                    continue
                 else:
-                    f[cols_to_flds[i]] = db_row[i]
-                    f[cols_to_flds[i] + fld_old_offset] = db_row[i]
-
-        for entry_change in entry_changes:
-            i = entry_change["column"]
-            if "new" in entry_change:
-                value = entry_change["new"]
-            elif "old" in entry_change:
-                value = entry_change["old"]
-            else:
-                value = "?"
-
-            if i == geom_col_index:
-                wkb_with_gpkg_hdr = base64.decodebytes(value.encode("ascii"))
-                wkb = parse_gpkg_geom_encoding(wkb_with_gpkg_hdr)
-                g = QgsGeometry()
-                g.fromWkb(wkb)
-                f.setGeometry(g)
+                    f[cols_to_flds[i]] = value
 
-                f[fld_geometry_idx] = g.asWkt()
-            else:
-                f[cols_to_flds[i]] = value
+            yield f
 
-        features.append(f)
 
-    return features
+def batched_features(features, batch_size=FEATURES_BATCH_SIZE):
+    """Splits iterable of features into lists of at most batch_size features, e.g. for adding them to a sink."""
+    features = iter(features)
+    batch = list(islice(features, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(features, batch_size))
 
 
 def get_table_name(layer):
@@ -289,8 +355,7 @@ def make_local_changes_layer(mp, layer):
 
     fields, cols_to_fields = create_field_list(db_schema[table_name])
 
-    db_conn = None  # no ref. db
-    db_conn = sqlite3.connect(base_file)
+    db_conn = connect_db_for_reading(base_file)
 
     features = diff_table_to_features(diff[table_name], db_schema[table_name], fields, cols_to_fields, db_conn)
 
@@ -305,7 +370,8 @@ def make_local_changes_layer(mp, layer):
 
     vl.dataProvider().addAttributes(fields)
     vl.updateFields()
-    vl.dataProvider().addFeatures(features)
+    for batch in batched_features(features):
+        vl.dataProvider().addFeatures(batch)
 
     style_diff_layer(vl, db_schema[table_name])
     return vl, ""
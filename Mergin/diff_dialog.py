@@ -2,7 +2,7 @@ import os
 
 from qgis.PyQt import uic
 from qgis.PyQt.QtCore import Qt, QSettings
-from qgis.PyQt.QtGui import QIcon, QColor
+from qgis.PyQt.QtGui import QColor
 from qgis.PyQt.QtWidgets import QDialog, QPushButton, QDialogButtonBox, QMenu, QAction
 from qgis.core import (
     QgsProject,
@@ -19,7 +19,7 @@ from qgis.utils import iface, OverrideCursor
 
 from .mergin.merginproject import MerginProject
 from .diff import make_local_changes_layer
-from .utils import icon_path
+from .utils import cached_icon, icon_path
 
 ui_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "ui_diff_viewer_dialog.ui")
 
@@ -69,10 +69,12 @@ class DiffViewerDialog(QDialog):
             btn_add_changes.setIcon(QgsApplication.getThemeIcon("/mActionAdd.svg"))
             menu = QMenu()
             add_current_action = menu.addAction(
-                QIcon(icon_path("file-plus.svg")), "Add current changes layer to project"
+                cached_icon(icon_path("file-plus.svg")), "Add current changes layer to project"
             )
             add_current_action.triggered.connect(self.add_current_to_project)
-            add_all_action = menu.addAction(QIcon(icon_path("folder-plus.svg")), "Add all changes layers to project")
+            add_all_action = menu.addAction(
+                cached_icon(icon_path("folder-plus.svg")), "Add all changes layers to project"
+            )
             add_all_action.triggered.connect(self.add_all_to_project)
             btn_add_changes.setMenu(menu)
 
@@ -6,12 +6,10 @@
 from math import floor
 import sip
 import os
-import shutil
 from pathlib import Path
-import posixpath
 from functools import partial
-from qgis.PyQt.QtCore import pyqtSignal, QTimer, QUrl, QSettings, Qt
-from qgis.PyQt.QtGui import QIcon, QDesktopServices, QPixmap
+from qgis.PyQt.QtCore import pyqtSignal, QThread, QTimer, QUrl, Qt
+from qgis.PyQt.QtGui import QDesktopServices, QPixmap
 from qgis.PyQt.QtWidgets import QDialog
 from qgis.core import (
     QgsApplication,
@@ -21,7 +19,6 @@ from qgis.core import (
     QgsDataProvider,
     QgsDirectoryItem,
     QgsErrorItem,
-    QgsExpressionContextUtils,
     QgsProject,
     QgsMapLayer,
     QgsProviderRegistry,
@@ -31,33 +28,37 @@ from qgis.utils import iface
 from qgis.PyQt.QtWidgets import QAction, QFileDialog, QMessageBox, QDockWidget
 from urllib.error import URLError
 
-from .configuration_dialog import ConfigurationDialog
-from .workspace_selection_dialog import WorkspaceSelectionDialog
-from .project_selection_dialog import ProjectSelectionDialog, PublicProjectSelectionDialog
-from .create_project_wizard import NewMerginProjectWizard
-from .clone_project_dialog import CloneProjectDialog
-from .diff_dialog import DiffViewerDialog
 from .project_settings_widget import MerginProjectConfigFactory
 from .projects_manager import MerginProjectsManager
 from .sync_dialog import SyncDialog
-from .configure_sync_wizard import DbSyncConfigWizard
-from .remove_project_dialog import RemoveProjectDialog
 from .utils import (
     ServerType,
     ClientError,
     LoginError,
-    check_mergin_subdirs,
+    cached_icon,
+    clear_icon_cache,
+    clear_local_project_paths_cache,
     create_mergin_client,
-    find_qgis_files,
-    get_mergin_auth,
     icon_path,
     mm_symbol_path,
     is_number,
+    LAST_WORKSPACE_SETTINGS_KEY,
+    local_project_paths,
     login_error_message,
+    MERGIN_GLOBAL_VARIABLES,
     mergin_project_local_path,
+    mergin_client_params,
+    mergin_settings,
+    message_log,
+    PLUGIN_DIR,
+    prerender_icons,
     PROJS_PER_PAGE,
+    remove_global_variables,
+    remove_local_project_path,
     remove_project_variables,
     same_dir,
+    SERVER_SETTINGS_KEY,
+    set_global_variables,
     unhandled_exception_message,
     unsaved_project_check,
     UnsavedChangesStrategy,
@@ -70,18 +71,100 @@ import processing
 MERGIN_CLIENT_LOG = os.path.join(QgsApplication.qgisSettingsDirPath(), "mergin-client-log.txt")
 os.environ["MERGIN_CLIENT_LOG"] = MERGIN_CLIENT_LOG
 
+# data providers of vector tile layers which can be made available offline
+if Qgis.versionInt() >= 33200:
+    VECTOR_TILE_PROVIDERS = frozenset(("xyzvectortiles", "arcgisvectortileservice", "vtpkvectortiles"))
+else:
+    VECTOR_TILE_PROVIDERS = frozenset(("vectortile",))
+
+
+class ClientCreator(QThread):
+    """
+    Class to handle creating Mergin Maps client (i.e. logging in to the server) in background worker thread
+    """
+
+    # client (None on failure), user info and error message
+    created = pyqtSignal(object, dict, str)
+
+    def __init__(self, client_params, generation):
+        """
+        ClientCreator constructor
+
+        :param client_params: parameters for the client, as returned by mergin_client_params()
+        :param generation: plugin configuration generation the client is created for
+        """
+        super(ClientCreator, self).__init__()
+        self.client_params = client_params
+        self.generation = generation
+
+    def run(self):
+        try:
+            mc = create_mergin_client(self.client_params)
+            user_info = mc.user_info()
+        except (URLError, ClientError, LoginError):
+            self.created.emit(None, {}, "Plugin not configured or \nQGIS master password not set up")
+            return
+        except Exception as err:
+            self.created.emit(None, {}, f"Error: {str(err)}")
+            return
+        self.created.emit(mc, user_info, "")
+
+
+class LocalChangesFetcher(QThread):
+    """
+    Class to handle computing local changes of Mergin Maps project in background worker thread
+    """
+
+    # summary of the local changes (None on failure) and error message
+    fetched = pyqtSignal(object, str)
+
+    def __init__(self, project_dir):
+        """
+        LocalChangesFetcher constructor
+
+        :param project_dir: local project directory
+        """
+        super(LocalChangesFetcher, self).__init__()
+        self.project_dir = project_dir
+
+    def run(self):
+        try:
+            mp = MerginProject(self.project_dir)
+            push_changes = mp.get_push_changes()
+            push_changes_summary = mp.get_list_of_push_changes(push_changes)
+        except Exception as err:
+            self.fetched.emit(None, str(err))
+            return
+        self.fetched.emit(push_changes_summary, "")
+
 
 class MerginPlugin:
     def __init__(self, iface):
         self.iface = iface
-        self.plugin_dir = os.path.dirname(__file__)
+        self.plugin_dir = PLUGIN_DIR
         self.data_item_provider = None
         self.actions = []
-        self.actions_always_on = []
+        self.actions_always_on = set()
         self.menu = "Mergin Maps"
         self.mergin_proj_dir = None
         self.mc = None
         self.manager = None
+        # tuple (client, user info) - user info is fetched just once per client
+        self.user_info_cache = None
+        # tuple (client, list of workspaces) - workspaces are listed just once per client
+        self.workspaces_cache = None
+        # running client creators, kept until their threads finish as a QThread must not be destroyed while running
+        self.client_creators = []
+        # incremented when the plugin is reconfigured, clients created for older configuration are discarded
+        self.client_generation = 0
+        # running local changes fetchers, kept until their threads finish the same way as client creators
+        self.local_changes_fetchers = []
+        # toolbar actions state is updated once per event loop iteration, no matter how many times it is requested
+        self.toolbar_actions_enable = None
+        self.toolbar_actions_timer = QTimer()
+        self.toolbar_actions_timer.setSingleShot(True)
+        self.toolbar_actions_timer.setInterval(0)
+        self.toolbar_actions_timer.timeout.connect(self.update_toolbar_actions)
         # current_workspace is a dict with "name" and "id" keys, empty dict() if the server does not support workspaces
         self.current_workspace = dict()
         self.provider = MerginProvider()
@@ -94,26 +177,32 @@ class MerginPlugin:
             self.iface.projectRead.connect(self.on_qgis_project_changed)
             self.iface.newProjectCreated.connect(self.on_qgis_project_changed)
 
-        settings = QSettings()
-        QgsExpressionContextUtils.setGlobalVariable("mergin_username", settings.value("Mergin/username", ""))
-        QgsExpressionContextUtils.setGlobalVariable("mergin_url", settings.value("Mergin/server", ""))
+        settings = mergin_settings()
+        set_global_variables(
+            {
+                "mergin_username": settings.value("Mergin/username", ""),
+                "mergin_url": settings.value(SERVER_SETTINGS_KEY, ""),
+            }
+        )
 
     def initProcessing(self):
         QgsApplication.processingRegistry().addProvider(self.provider)
 
     def initGui(self):
+        self.initProcessing()
+
         # This is a quick fix for a bad crasher for users that have set up master password for their
         # storage of authentication configurations. What would happen is that in a worker thread,
         # QGIS browser model would start populating Mergin data items which would want to query Mergin
         # server and thus request auth info - but as this would be done in a background thread,
         # things will get horribly wrong when QGIS tries to display GUI and the app would crash.
-        # Triggering auth request to QGIS auth framework already at this point will make sure that
-        # the dialog asking for master password is started from the main thread -> no crash.
-        get_mergin_auth()
-
-        self.initProcessing()
-
-        self.create_manager()
+        # Creating the client (which triggers auth request to QGIS auth framework via get_mergin_auth())
+        # already at this point will make sure that the dialog asking for master password is started
+        # from the main thread -> no crash. Browser items only use the client created here.
+        # Logging in to the server is deferred until QGIS finishes loading and it is done in a worker thread, so
+        # that it does not block the GUI. Only the auth info is read in the main thread.
+        # Until then the browser item has no client and does not query the server from the worker thread at all.
+        QTimer.singleShot(0, self.create_manager_in_background)
 
         if self.iface is not None:
             self.add_action(
@@ -130,7 +219,7 @@ class MerginPlugin:
                 add_to_menu=True,
                 add_to_toolbar=self.toolbar,
             )
-            self.add_action(
+            self.action_create_project = self.add_action(
                 "square-plus.svg",
                 text="Create Mergin Maps Project",
                 callback=self.create_new_project,
@@ -158,6 +247,18 @@ class MerginPlugin:
 
             self.enable_toolbar_actions()
 
+        # browser items are populated in a worker thread, where pixmaps can't be created
+        prerender_icons(
+            [
+                icon_path("cloud.svg"),
+                icon_path("dots.svg"),
+                icon_path("alert-triangle.svg"),
+                icon_path("square-plus.svg"),
+                icon_path("user.svg"),
+                icon_path("users.svg"),
+                mm_symbol_path(),
+            ]
+        )
         self.data_item_provider = DataItemProvider(self)
         QgsApplication.instance().dataItemProviderRegistry().addProvider(self.data_item_provider)
         # related to https://github.com/MerginMaps/qgis-mergin-plugin/issues/3
@@ -171,13 +272,13 @@ class MerginPlugin:
 
             # add layer context menu action for checking local changes
             self.action_show_changes = QAction("Show Local Changes", self.iface.mainWindow())
-            self.action_show_changes.setIcon(QIcon(icon_path("file-diff.svg")))
+            self.action_show_changes.setIcon(cached_icon(icon_path("file-diff.svg")))
             self.iface.addCustomActionForLayerType(self.action_show_changes, "", QgsMapLayer.VectorLayer, True)
             self.action_show_changes.triggered.connect(self.view_local_changes)
 
             # add layer context menu action for downloading vector tiles
             self.action_export_mbtiles = QAction("Make available offline…", self.iface.mainWindow())
-            self.action_export_mbtiles.setIcon(QIcon(icon_path("file-export.svg")))
+            self.action_export_mbtiles.setIcon(cached_icon(icon_path("file-export.svg")))
             self.iface.addCustomActionForLayerType(self.action_export_mbtiles, "", QgsMapLayer.VectorTileLayer, False)
             self.action_export_mbtiles.triggered.connect(self.export_vector_tiles)
 
@@ -197,7 +298,7 @@ class MerginPlugin:
         checked=False,
         always_on=True,
     ):
-        icon = QIcon(icon_path(icon_name))
+        icon = cached_icon(icon_path(icon_name))
         action = QAction(icon, text, self.iface.mainWindow())
         action.triggered.connect(callback)
         action.setCheckable(checkable)
@@ -215,7 +316,7 @@ class MerginPlugin:
 
         self.actions.append(action)
         if always_on:
-            self.actions_always_on.append(text)
+            self.actions_always_on.add(action)
         return action
 
     def create_manager(self):
@@ -229,19 +330,74 @@ class MerginPlugin:
         except (URLError, ClientError, LoginError):
             error = "Plugin not configured or \nQGIS master password not set up"
         except Exception as err:
-            error = "Error: {}".format(str(err))
+            error = f"Error: {str(err)}"
         if error:
             self.mc = None
             self.manager = None
-        if self.has_browser_item():
-            self.data_item_provider.root_item.update_client_and_manager(mc=self.mc, manager=self.manager, err=error)
+        root_item = self.browser_root_item()
+        if root_item is not None:
+            root_item.update_client_and_manager(mc=self.mc, manager=self.manager, err=error)
+
+    def user_info(self):
+        """
+        Get info about the user from the server. The response is cached until the client is replaced
+        (i.e. the plugin is reconfigured) or invalidate_user_info() is called.
+        """
+        if self.user_info_cache is None or self.user_info_cache[0] is not self.mc:
+            self.user_info_cache = (self.mc, self.mc.user_info())
+        return self.user_info_cache[1]
+
+    def invalidate_user_info(self):
+        """Drop cached user info and workspaces, e.g. when the user's workspaces could have changed."""
+        self.user_info_cache = None
+        self.workspaces_cache = None
+
+    def workspaces(self):
+        """
+        Get list of workspaces the user has access to. The response is cached the same way as user_info().
+        """
+        if self.workspaces_cache is None or self.workspaces_cache[0] is not self.mc:
+            self.workspaces_cache = (self.mc, self.mc.workspaces_list())
+        return self.workspaces_cache[1]
+
+    def create_manager_in_background(self):
+        """Create Mergin Maps client in a worker thread and then the projects manager."""
+        try:
+            client_params = mergin_client_params()
+        except (URLError, ClientError, LoginError):
+            self.client_created(
+                self.client_generation, None, {}, "Plugin not configured or \nQGIS master password not set up"
+            )
+            return
+        creator = ClientCreator(client_params, self.client_generation)
+        creator.created.connect(partial(self.client_created, self.client_generation))
+        creator.finished.connect(lambda: self.client_creators.remove(creator))
+        self.client_creators.append(creator)
+        creator.start()
+
+    def is_creating_client(self):
+        """Whether Mergin Maps client is being created in a worker thread."""
+        return any(creator.generation == self.client_generation for creator in self.client_creators)
+
+    def client_created(self, generation, mc, user_info, error):
+        """Called when Mergin Maps client was created in the worker thread (mc is None on failure)."""
+        if generation != self.client_generation:
+            # plugin was reconfigured in the meantime, the client is created for outdated settings
+            return
+        if mc is None:
+            self.mc = None
+            self.manager = None
+            root_item = self.browser_root_item()
+            if root_item is not None:
+                root_item.update_client_and_manager(err=error)
+            return
+        self.mc = mc
+        self.user_info_cache = (mc, user_info)
+        self.on_config_changed()
 
-    def has_browser_item(self):
-        """Check if the Mergin Maps provider Browser item exists and has the root item defined."""
-        if self.data_item_provider is not None:
-            if self.data_item_provider.root_item is not None:
-                return True
-        return False
+    def browser_root_item(self):
+        """Get the Mergin Maps provider Browser root item, None if it does not exist (yet)."""
+        return getattr(self.data_item_provider, "root_item", None)
 
     def on_config_changed(self):
         """Called when plugin config (connection settings) were changed."""
@@ -257,29 +413,37 @@ class MerginPlugin:
             url = QUrl(self.mc.url)
 
         if path:
-            url_path = url.path()
-            while url_path.endswith("/"):
-                url_path = url_path[:-1]
-            url.setPath(f"{url_path}{path}")
+            url.setPath(url.path().rstrip("/") + path)
         QDesktopServices.openUrl(url)
 
     def enable_toolbar_actions(self, enable=None):
+        """
+        Schedule update of Mergin Maps Toolbar icons. Subsequent calls before the update happens are coalesced,
+        the last requested state wins.
+        """
+        self.toolbar_actions_enable = enable
+        self.toolbar_actions_timer.start()
+
+    def update_toolbar_actions(self):
         """Check current project and set Mergin Maps Toolbar icons enabled accordingly."""
+        enable = self.toolbar_actions_enable
         if enable is None:
             enable = mergin_project_local_path() is not None
         if self.manager is None:
             enable = False
         for action in self.toolbar.actions():
-            if action.text() in self.actions_always_on:
+            if action in self.actions_always_on:
                 action.setEnabled(True)
-            elif action.text() == "Create Mergin Maps Project":
+            elif action is self.action_create_project:
                 action.setEnabled(self.mc is not None and self.manager is not None)
             else:
                 action.setEnabled(enable)
 
     def show_browser_panel(self):
         """Check if QGIS Browser panel is open. If not, ask and eventually make it visible to users."""
-        browser = [w for w in self.iface.mainWindow().findChildren(QDockWidget) if w.objectName() == "Browser"][0]
+        browser = self.iface.mainWindow().findChild(QDockWidget, "Browser")
+        if browser is None:
+            return
         q = "QGIS Browser panel is currently off. The panel is used for Mergin Maps projects management.\n"
         q += "Would you like to open it and see your Mergin projects?"
         if not browser.isVisible():
@@ -289,9 +453,14 @@ class MerginPlugin:
 
     def configure(self):
         """Open plugin configuration dialog."""
+        from .configuration_dialog import ConfigurationDialog
+
         dlg = ConfigurationDialog()
         if dlg.exec():
+            self.client_generation += 1
             self.mc = dlg.writeSettings()
+            # cached user info belongs to the previous client, do not keep it alive
+            self.invalidate_user_info()
             self.on_config_changed()
             self.show_browser_panel()
 
@@ -302,7 +471,7 @@ class MerginPlugin:
             iface.messageBar().pushMessage("Mergin", "Project is not saved, please save project first", Qgis.Warning)
             return
 
-        if not check_mergin_subdirs(project_path):
+        if not os.path.isdir(os.path.join(project_path, ".mergin")):
             iface.messageBar().pushMessage(
                 "Mergin", "Current project is not a Mergin project. Please open a Mergin project first.", Qgis.Warning
             )
@@ -317,6 +486,8 @@ class MerginPlugin:
             )
             return
 
+        from .configure_sync_wizard import DbSyncConfigWizard
+
         wizard = DbSyncConfigWizard(project_name)
         if not wizard.exec():
             return
@@ -329,7 +500,11 @@ class MerginPlugin:
         )
         msg_box = QMessageBox(QMessageBox.Icon.Critical, "You do not have any workspace", msg, QMessageBox.Close)
         create_button = msg_box.addButton("Create workspace", msg_box.ActionRole)
-        create_button.clicked.disconnect()
+        try:
+            # do not let the button close the message box
+            create_button.clicked.disconnect()
+        except TypeError:
+            pass  # there were no connections
         create_button.clicked.connect(partial(self.open_configured_url, "/workspaces"))
         msg_box.exec()
 
@@ -339,12 +514,15 @@ class MerginPlugin:
 
         :param workspace: Dict containing workspace's "name" and "id" keys
         """
-        settings = QSettings()
+        settings = mergin_settings()
         self.current_workspace = workspace
         workspace_id = self.current_workspace.get("id", None)
-        settings.setValue("Mergin/lastUsedWorkspaceId", workspace_id)
-        if self.has_browser_item():
-            self.data_item_provider.root_item.update_client_and_manager(mc=self.mc, manager=self.manager)
+        # avoid writing the settings file when the same workspace is chosen again
+        if settings.value(LAST_WORKSPACE_SETTINGS_KEY, None, int) != workspace_id:
+            settings.setValue(LAST_WORKSPACE_SETTINGS_KEY, workspace_id)
+        root_item = self.browser_root_item()
+        if root_item is not None:
+            root_item.update_client_and_manager(mc=self.mc, manager=self.manager)
 
         if self.mc.server_type() == ServerType.SAAS and workspace_id:
             # check action required flag
@@ -369,14 +547,15 @@ class MerginPlugin:
         Called after connecting to server.
         Chooses and sets the current workspace based on workspace availability and last used workspace.
         """
-        user_info = self.mc.user_info()
+        user_info = self.user_info()
         workspaces = user_info.get("workspaces", None)
         if not workspaces:
             if workspaces is None:
                 # server is old, does not support workspaces
                 self.current_workspace = dict()
             else:
-                # User has no workspaces
+                # User has no workspaces, they might create one on the server
+                self.invalidate_user_info()
                 self.show_no_workspaces_dialog()
                 self.current_workspace = dict()
             return
@@ -384,19 +563,12 @@ class MerginPlugin:
         if len(workspaces) == 1:
             workspace = workspaces[0]
         else:
-            settings = QSettings()
-            previous_workspace = settings.value("Mergin/lastUsedWorkspaceId", None, int)
-            workspace = None
-            for ws in workspaces:
-                if previous_workspace == ws["id"]:
-                    workspace = ws
-                    break
-
-        if not workspace:
-            for ws in workspaces:
-                if user_info["preferred_workspace"] == ws["id"]:
-                    workspace = ws
-                    break
+            settings = mergin_settings()
+            previous_workspace = settings.value(LAST_WORKSPACE_SETTINGS_KEY, None, int)
+            workspaces_by_id = {ws["id"]: ws for ws in workspaces}
+            workspace = workspaces_by_id.get(previous_workspace) or workspaces_by_id.get(
+                user_info["preferred_workspace"]
+            )
 
         self.set_current_workspace(workspace)
 
@@ -409,9 +581,10 @@ class MerginPlugin:
             QMessageBox.warning(None, "Create Mergin Maps Project", "Plugin not configured!")
             return
 
-        user_info = self.mc.user_info()
+        user_info = self.user_info()
         workspaces = user_info.get("workspaces", None)
         if not workspaces and workspaces is not None:
+            self.invalidate_user_info()
             self.show_no_workspaces_dialog()
             self.current_workspace = dict()
             return
@@ -420,13 +593,16 @@ class MerginPlugin:
         if self.mc.server_type() == ServerType.OLD:
             default_workspace = user_info["username"]
 
+        from .create_project_wizard import NewMerginProjectWizard
+
         wizard = NewMerginProjectWizard(self.manager, user_info=user_info, default_workspace=default_workspace)
         if not wizard.exec():
             return  # cancelled
-        if self.has_browser_item():
+        root_item = self.browser_root_item()
+        if root_item is not None:
             # make sure the item has the link between remote and local project we have just added
-            self.data_item_provider.root_item.depopulate()
-            self.data_item_provider.root_item.reload()
+            root_item.depopulate()
+            root_item.reload()
 
     def current_project_sync(self):
         """Synchronise current Mergin Maps project."""
@@ -434,6 +610,8 @@ class MerginPlugin:
 
     def find_project(self):
         """Open new Find Mergin Maps project dialog"""
+        from .project_selection_dialog import ProjectSelectionDialog
+
         dlg = ProjectSelectionDialog(self.mc, self.current_workspace.get("name", None))
         dlg.new_project_clicked.connect(self.create_new_project)
         dlg.switch_workspace_clicked.connect(self.switch_workspace)
@@ -441,7 +619,7 @@ class MerginPlugin:
         dlg.download_project_clicked.connect(self.manager.download_project)
 
         try:
-            workspaces = self.mc.workspaces_list()
+            workspaces = self.workspaces()
             dlg.enable_workspace_switching(len(workspaces) > 1)
         except:
             pass
@@ -451,15 +629,18 @@ class MerginPlugin:
     def switch_workspace(self):
         """Open new Switch workspace dialog"""
         try:
-            workspaces = self.mc.workspaces_list()
+            workspaces = self.workspaces()
         except (URLError, ClientError) as e:
             return  # Server does not support workspaces
 
         if not workspaces:
+            self.invalidate_user_info()
             self.show_no_workspaces_dialog()
             self.current_workspace = dict()
             return
 
+        from .workspace_selection_dialog import WorkspaceSelectionDialog
+
         dlg = WorkspaceSelectionDialog(workspaces)
         dlg.manage_workspaces_clicked.connect(self.open_configured_url)
         if not dlg.exec():
@@ -470,6 +651,8 @@ class MerginPlugin:
 
     def explore_public_projects(self):
         """Open new Explore public Mergin Maps projects dialog"""
+        from .project_selection_dialog import PublicProjectSelectionDialog
+
         dlg = PublicProjectSelectionDialog(self.mc)
         dlg.open_project_clicked.connect(self.manager.open_project)
         dlg.download_project_clicked.connect(self.manager.download_project)
@@ -481,20 +664,32 @@ class MerginPlugin:
         If a loaded project is not a Mergin Maps project, there are no Mergin variables by default.
         If a loaded project is invalid - doesnt have metadata, Mergin variables are removed.
         """
-        self.enable_toolbar_actions(enable=False)
         self.mergin_proj_dir = mergin_project_local_path()
-        if self.mergin_proj_dir is not None:
-            self.enable_toolbar_actions()
+        self.enable_toolbar_actions(enable=self.mergin_proj_dir is not None)
 
     def add_context_menu_actions(self, layers):
-        provider_names = "vectortile"
-        if Qgis.versionInt() >= 33200:
-            provider_names = ("xyzvectortiles", "arcgisvectortileservice", "vtpkvectortiles")
         for l in layers:
-            if l.dataProvider().name() in provider_names:
+            # cheap layer type check first, most of the added layers are not vector tiles
+            if l.type() != QgsMapLayer.VectorTileLayer:
+                continue
+            if l.dataProvider().name() in VECTOR_TILE_PROVIDERS:
                 self.iface.addCustomActionForLayer(self.action_export_mbtiles, l)
 
     def unload(self):
+        self.toolbar_actions_timer.stop()
+        # do not let the worker threads outlive the plugin, lists are cleared here so their removal from
+        # the lists once finished must not be triggered anymore
+        for creator in self.client_creators:
+            creator.created.disconnect()
+            creator.finished.disconnect()
+            creator.wait()
+        self.client_creators = []
+        for fetcher in self.local_changes_fetchers:
+            fetcher.fetched.disconnect()
+            fetcher.finished.disconnect()
+            fetcher.wait()
+        self.local_changes_fetchers = []
+
         if self.iface is not None:
             # Disconnect Mergin related signals
             self.iface.projectRead.disconnect(self.on_qgis_project_changed)
@@ -510,14 +705,15 @@ class MerginPlugin:
             self.iface.unregisterProjectPropertiesWidgetFactory(self.mergin_project_config_factory)
 
         remove_project_variables()
-        QgsExpressionContextUtils.removeGlobalVariable("mergin_username")
-        QgsExpressionContextUtils.removeGlobalVariable("mergin_url")
+        remove_global_variables(MERGIN_GLOBAL_VARIABLES)
         QgsApplication.instance().dataItemProviderRegistry().removeProvider(self.data_item_provider)
         self.data_item_provider = None
         # this is crashing qgis on exit
         # self.iface.browserModel().reload()
 
         QgsApplication.processingRegistry().removeProvider(self.provider)
+        # modules stay imported when the plugin is disabled, let the icons be re-created if it is loaded again
+        clear_icon_cache()
 
     def view_local_changes(self):
         project_path = QgsProject.instance().homePath()
@@ -527,7 +723,7 @@ class MerginPlugin:
             )
             return
 
-        if not check_mergin_subdirs(project_path):
+        if not os.path.isdir(os.path.join(project_path, ".mergin")):
             iface.messageBar().pushMessage("Mergin", "Current project is not a Mergin project.", Qgis.Warning)
             return
 
@@ -535,9 +731,21 @@ class MerginPlugin:
         if check_result == UnsavedChangesStrategy.HasUnsavedChanges:
             return
 
-        mp = MerginProject(QgsProject.instance().homePath())
-        push_changes = mp.get_push_changes()
-        push_changes_summary = mp.get_list_of_push_changes(push_changes)
+        if self.local_changes_fetchers:
+            return  # local changes are being computed already
+
+        # computing diffs of large GeoPackages can take a while, do not block the GUI
+        fetcher = LocalChangesFetcher(project_path)
+        fetcher.fetched.connect(partial(self.local_changes_fetched, check_result))
+        fetcher.finished.connect(lambda: self.local_changes_fetchers.remove(fetcher))
+        self.local_changes_fetchers.append(fetcher)
+        fetcher.start()
+
+    def local_changes_fetched(self, check_result, push_changes_summary, error):
+        """Called when local changes were computed in the worker thread, shows them in the diff viewer."""
+        if error:
+            iface.messageBar().pushMessage("Mergin", f"Failed to compute local changes: {error}", Qgis.Warning)
+            return
         if not push_changes_summary:
             iface.messageBar().pushMessage("Mergin", "No changes found in the project layers.", Qgis.Info)
             return
@@ -552,6 +760,8 @@ class MerginPlugin:
                 layer_name = layer.name()
                 break
 
+        from .diff_dialog import DiffViewerDialog
+
         dlg_diff_viewer = DiffViewerDialog()
         if check_result == UnsavedChangesStrategy.HasUnsavedChangesButIgnore:
             dlg_diff_viewer.show_unsaved_changes_warning()
@@ -581,22 +791,22 @@ class MerginRemoteProjectItem(QgsDataItem):
 
     def __init__(self, parent, project, project_manager):
         self.project = project
-        self.project_name = posixpath.join(
-            project["namespace"], project["name"]
-        )  # we need posix path for server API calls
+        self.project_name = f"{project['namespace']}/{project['name']}"  # we need posix path for server API calls
         display_name = project["name"]
-        group_items = project_manager.get_mergin_browser_groups()
-        if group_items.get("Shared with me") == parent:
+        # projects shared with the user come from different namespaces - the parent item knows if that is the case,
+        # no need to look up the browser groups for each project
+        if getattr(parent, "filter", None) == "shared":
             display_name = self.project_name
         QgsDataItem.__init__(self, QgsDataItem.Collection, parent, display_name, "/Mergin/" + self.project_name)
         self.path = None
         self.setSortKey(f"1 {self.name()}")
-        self.setIcon(QIcon(icon_path("cloud.svg")))
+        self.setIcon(cached_icon(icon_path("cloud.svg")))
         self.project_manager = project_manager
         if self.project_manager is not None:
             self.mc = self.project_manager.mc
         else:
             self.mc = None
+        self.item_actions = None
 
     def download(self):
         self.project_manager.download_project(self.project)
@@ -606,7 +816,9 @@ class MerginRemoteProjectItem(QgsDataItem):
         self.project_manager.open_project(self.path)
 
     def clone_remote_project(self):
-        user_info = self.mc.user_info()
+        user_info = self.parent().plugin.user_info()
+
+        from .clone_project_dialog import CloneProjectDialog
 
         dlg = CloneProjectDialog(user_info=user_info, default_workspace=self.project["namespace"])
         if not dlg.exec():
@@ -614,7 +826,7 @@ class MerginRemoteProjectItem(QgsDataItem):
         try:
             self.mc.clone_project(self.project_name, dlg.project_name, dlg.project_namespace)
         except (URLError, ClientError) as e:
-            msg = "Failed to clone project {}:\n\n{}".format(self.project_name, str(e))
+            msg = f"Failed to clone project {self.project_name}:\n\n{str(e)}"
             QMessageBox.critical(None, "Clone project", msg, QMessageBox.Close)
             return
         except LoginError as e:
@@ -622,13 +834,11 @@ class MerginRemoteProjectItem(QgsDataItem):
             return
         msg = "Mergin Maps project cloned successfully."
         QMessageBox.information(None, "Clone project", msg, QMessageBox.Close)
-        self.parent().reload()
-        # we also need to reload My projects group as the cloned project could appear there
-        group_items = self.project_manager.get_mergin_browser_groups()
-        if "My projects" in group_items:
-            group_items["My projects"].reload()
+        self.parent().project_cloned(dlg.project_namespace)
 
     def remove_remote_project(self):
+        from .remove_project_dialog import RemoveProjectDialog
+
         dlg = RemoveProjectDialog(self.project_name)
         if dlg.exec() == QDialog.Rejected:
             return
@@ -637,38 +847,43 @@ class MerginRemoteProjectItem(QgsDataItem):
             self.mc.delete_project(self.project_name)
             msg = "Mergin Maps project removed successfully."
             QMessageBox.information(None, "Remove project", msg, QMessageBox.Close)
-            self.parent().reload()
+            self.parent().project_removed(self)
         except (URLError, ClientError) as e:
-            msg = "Failed to remove project {}:\n\n{}".format(self.project_name, str(e))
+            msg = f"Failed to remove project {self.project_name}:\n\n{str(e)}"
             QMessageBox.critical(None, "Remove project", msg, QMessageBox.Close)
         except LoginError as e:
             login_error_message(e)
 
     def actions(self, parent):
-        action_download = QAction(QIcon(icon_path("cloud-download.svg")), "Download", parent)
+        # actions are created just once for the item, they are not parented to the context menu so they
+        # are not deleted together with it
+        if self.item_actions is not None:
+            return self.item_actions
+
+        action_download = QAction(cached_icon(icon_path("cloud-download.svg")), "Download", None)
         action_download.triggered.connect(self.download)
 
-        action_clone_remote = QAction(QIcon(icon_path("copy.svg")), "Clone", parent)
+        action_clone_remote = QAction(cached_icon(icon_path("copy.svg")), "Clone", None)
         action_clone_remote.triggered.connect(self.clone_remote_project)
 
-        action_remove_remote = QAction(QIcon(icon_path("trash.svg")), "Remove from server", parent)
-        action_remove_remote.triggered.connect(self.remove_remote_project)
-
-        actions = [action_download, action_clone_remote]
+        self.item_actions = [action_download, action_clone_remote]
         if self.project["permissions"]["delete"]:
-            actions.append(action_remove_remote)
-        return actions
+            action_remove_remote = QAction(cached_icon(icon_path("trash.svg")), "Remove from server", None)
+            action_remove_remote.triggered.connect(self.remove_remote_project)
+            self.item_actions.append(action_remove_remote)
+        return self.item_actions
 
 
 class MerginLocalProjectItem(QgsDirectoryItem):
     """Data item to represent a local Mergin Maps project."""
 
-    def __init__(self, parent, project, project_manager):
-        self.project_name = posixpath.join(project["namespace"], project["name"])  # posix path for server API calls
-        self.path = mergin_project_local_path(self.project_name)
+    def __init__(self, parent, project, project_manager, local_path=None):
+        self.project_name = f"{project['namespace']}/{project['name']}"  # posix path for server API calls
+        self.path = local_path if local_path is not None else mergin_project_local_path(self.project_name)
         display_name = project["name"]
-        group_items = project_manager.get_mergin_browser_groups()
-        if group_items.get("Shared with me") == parent:
+        # projects shared with the user come from different namespaces - the parent item knows if that is the case,
+        # no need to look up the browser groups for each project
+        if getattr(parent, "filter", None) == "shared":
             display_name = self.project_name
         QgsDirectoryItem.__init__(self, parent, display_name, self.path, "/Mergin/" + self.project_name)
         self.setSortKey(f"0 {self.name()}")
@@ -678,6 +893,7 @@ class MerginLocalProjectItem(QgsDirectoryItem):
             self.mc = self.project_manager.mc
         else:
             self.mc = None
+        self.item_actions = None
 
     def open_project(self):
         self.project_manager.open_project(self.path)
@@ -694,7 +910,7 @@ class MerginLocalProjectItem(QgsDirectoryItem):
         cur_proj_path = cur_proj.absolutePath()
         msg = (
             "Your local changes will be lost. Make sure your project is synchronised with server. \n\n"
-            "Do you want to proceed?".format(self.project_name)
+            "Do you want to proceed?"
         )
         btn_reply = QMessageBox.question(
             None, "Remove local project", msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
@@ -702,13 +918,10 @@ class MerginLocalProjectItem(QgsDirectoryItem):
         if btn_reply == QMessageBox.No:
             return
 
-        if os.path.exists(self.path):
+        if os.path.isdir(self.path):
             try:
                 if same_dir(cur_proj_path, self.path):
-                    msg = (
-                        "The project is currently open. It will get cleared if you proceed.\n\n"
-                        "Proceed anyway?".format(self.project_name)
-                    )
+                    msg = "The project is currently open. It will get cleared if you proceed.\n\nProceed anyway?"
                     btn_reply = QMessageBox.question(
                         None, "Remove local project", msg, QMessageBox.No | QMessageBox.No, QMessageBox.Yes
                     )
@@ -732,9 +945,9 @@ class MerginLocalProjectItem(QgsDirectoryItem):
                 # as releasing lock on previously open files takes some time
                 # we have to wait a bit before removing them, otherwise rmtree
                 # will fail and removal of the local rpoject will fail as well
-                QTimer.singleShot(250, lambda: shutil.rmtree(self.path))
+                self.project_manager.remove_project_dir(self.path, delay=250)
             except PermissionError as e:
-                QgsApplication.messageLog().logMessage(f"Mergin Maps plugin: {str(e)}")
+                message_log().logMessage(f"Mergin Maps plugin: {str(e)}")
                 msg = (
                     f"Failed to delete your project {self.project_name} because it is open.\n"
                     "You might need to close project or QGIS to remove its files."
@@ -742,9 +955,9 @@ class MerginLocalProjectItem(QgsDirectoryItem):
                 QMessageBox.critical(None, "Project delete", msg, QMessageBox.Close)
                 return
 
-        settings = QSettings()
-        settings.remove(f"Mergin/localProjects/{self.project_name}")
-        self.parent().reload()
+        remove_local_project_path(self.project_name, remove_all=True)
+        # the project is still on the server, so the items can be re-created from the already fetched projects
+        self.parent().refresh_projects()
 
     def submit_logs(self):
         if not self.path:
@@ -752,7 +965,9 @@ class MerginLocalProjectItem(QgsDirectoryItem):
         self.project_manager.submit_logs(self.path)
 
     def clone_remote_project(self):
-        user_info = self.mc.user_info()
+        user_info = self.parent().plugin.user_info()
+
+        from .clone_project_dialog import CloneProjectDialog
 
         dlg = CloneProjectDialog(user_info=user_info, default_workspace=self.project["namespace"])
 
@@ -762,37 +977,42 @@ class MerginLocalProjectItem(QgsDirectoryItem):
             self.mc.clone_project(self.project_name, dlg.project_name, dlg.project_namespace)
             msg = "Mergin Maps project cloned successfully."
             QMessageBox.information(None, "Clone project", msg, QMessageBox.Close)
-            self.parent().reload()
+            self.parent().project_cloned(dlg.project_namespace)
         except (URLError, ClientError) as e:
-            msg = "Failed to clone project {}:\n\n{}".format(self.project_name, str(e))
+            msg = f"Failed to clone project {self.project_name}:\n\n{str(e)}"
             QMessageBox.critical(None, "Clone project", msg, QMessageBox.Close)
         except LoginError as e:
             login_error_message(e)
 
     def actions(self, parent):
-        action_remove_local = QAction(QIcon(icon_path("trash.svg")), "Remove locally", parent)
+        # actions are created just once for the item, they are not parented to the context menu so they
+        # are not deleted together with it
+        if self.item_actions is not None:
+            return self.item_actions
+
+        action_remove_local = QAction(cached_icon(icon_path("trash.svg")), "Remove locally", None)
         action_remove_local.triggered.connect(self.remove_local_project)
 
-        action_open_project = QAction("Open QGIS project", parent)
+        action_open_project = QAction("Open QGIS project", None)
         action_open_project.triggered.connect(self.open_project)
 
-        action_sync_project = QAction(QIcon(icon_path("refresh.svg")), "Synchronise", parent)
+        action_sync_project = QAction(cached_icon(icon_path("refresh.svg")), "Synchronise", None)
         action_sync_project.triggered.connect(self.sync_project)
 
-        action_clone_remote = QAction(QIcon(icon_path("copy.svg")), "Clone", parent)
+        action_clone_remote = QAction(cached_icon(icon_path("copy.svg")), "Clone", None)
         action_clone_remote.triggered.connect(self.clone_remote_project)
 
-        action_diagnostic_log = QAction(QIcon(icon_path("first-aid-kit.svg")), "Diagnostic log", parent)
+        action_diagnostic_log = QAction(cached_icon(icon_path("first-aid-kit.svg")), "Diagnostic log", None)
         action_diagnostic_log.triggered.connect(self.submit_logs)
 
-        actions = [
+        self.item_actions = [
             action_open_project,
             action_sync_project,
             action_clone_remote,
             action_remove_local,
             action_diagnostic_log,
         ]
-        return actions
+        return self.item_actions
 
 
 class FetchMoreItem(QgsDataItem):
@@ -801,7 +1021,7 @@ class FetchMoreItem(QgsDataItem):
     def __init__(self, parent):
         self.parent = parent
         QgsDataItem.__init__(self, QgsDataItem.Collection, parent, "Double-click for more...", "")
-        self.setIcon(QIcon(icon_path("dots.svg")))
+        self.setIcon(cached_icon(icon_path("dots.svg")))
         self.setSortKey("2")  # the item should appear at the bottom of the list
 
     def handleDoubleClick(self):
@@ -816,7 +1036,7 @@ class ErrorItem(QgsErrorItem):
         QgsErrorItem.__init__(self, parent, error, path)
         self.parent = parent
         self.handler = double_click_handler
-        self.setIcon(QIcon(icon_path("alert-triangle.svg")))
+        self.setIcon(cached_icon(icon_path("alert-triangle.svg")))
 
     def handleDoubleClick(self):
         if self.handler:
@@ -826,13 +1046,22 @@ class ErrorItem(QgsErrorItem):
             return False
 
 
+class LoadingItem(QgsDataItem):
+    """Data item shown while the Mergin Maps client is being created."""
+
+    def __init__(self, parent):
+        QgsDataItem.__init__(self, QgsDataItem.Collection, parent, "Loading…", "")
+        self.setIcon(cached_icon(icon_path("refresh.svg")))
+        self.setState(QgsDataItem.Populated)
+
+
 class CreateNewProjectItem(QgsDataItem):
     """Data item to represent an action to create a new project."""
 
     def __init__(self, parent):
         self.parent = parent
         QgsDataItem.__init__(self, QgsDataItem.Collection, parent, "Create new project...", "")
-        self.setIcon(QIcon(icon_path("square-plus.svg")))
+        self.setIcon(cached_icon(icon_path("square-plus.svg")))
 
     def handleDoubleClick(self):
         self.parent.new_project()
@@ -856,7 +1085,7 @@ class MerginRootItem(QgsDataCollectionItem):
         if name != providerKey:
             providerKey = "/Mergin" + name
         QgsDataCollectionItem.__init__(self, parent, name, providerKey)
-        self.setIcon(QIcon(mm_symbol_path()))
+        self.setIcon(cached_icon(mm_symbol_path()))
         self.setSortKey(order)
         self.plugin = plugin
         self.project_manager = plugin.manager
@@ -865,8 +1094,10 @@ class MerginRootItem(QgsDataCollectionItem):
         self.wizard = None
         self.projects = []
         self.total_projects_count = None
+        self.page_to_fetch = None
         self.fetch_more_item = None
         self.create_new_project_item = None
+        self.item_actions = dict()
         self.filter = flag
         self.base_name = self.name()
         self.updateName()
@@ -891,13 +1122,19 @@ class MerginRootItem(QgsDataCollectionItem):
         self.setName(name)
 
     def createChildren(self):
+        if not self.error and self.mc is None and self.plugin.is_creating_client():
+            # configured account is still being logged in, the item is updated once the client is created
+            loading_item = LoadingItem(self)
+            sip.transferto(loading_item, self)
+            return [loading_item]
+
         if self.error or self.mc is None:
             handler = None
             if not self.error:
                 handler = self.configure
                 self.error = "Double-click to configure…"
             error_item = ErrorItem(self, self.error, "Mergin/error", handler)
-            error_item.setIcon(QIcon(icon_path("alert-triangle.svg")))
+            error_item.setIcon(cached_icon(icon_path("alert-triangle.svg")))
             sip.transferto(error_item, self)
             return [error_item]
 
@@ -907,21 +1144,34 @@ class MerginRootItem(QgsDataCollectionItem):
         return self.createChildrenProjects()
 
     def createChildrenProjects(self):
-        if not self.projects:
-            error = self.fetch_projects()
-            if error is not None:
+        # createChildren() is run by QGIS browser model in a worker thread, so this is the place
+        # where all the blocking requests to the server should be done
+        error = None
+        if not self.projects or self.page_to_fetch is not None:
+            page = self.page_to_fetch if self.page_to_fetch is not None else 1
+            self.page_to_fetch = None
+            error = self.fetch_projects(page=page)
+            if error is not None and not self.projects:
                 return error
         items = []
+        # read local projects paths just once for all the projects
+        local_paths = local_project_paths()
         for project in self.projects:
-            project_name = posixpath.join(project["namespace"], project["name"])  # posix path for server API calls
-            local_proj_path = mergin_project_local_path(project_name)
-            if local_proj_path is None or not os.path.exists(local_proj_path):
+            project_name = f"{project['namespace']}/{project['name']}"  # posix path for server API calls
+            local_proj_path = None
+            if project_name in local_paths:
+                # also validates the path, so there is no need to check it again
+                local_proj_path = mergin_project_local_path(project_name)
+            if local_proj_path is None:
                 item = MerginRemoteProjectItem(self, project, self.project_manager)
                 item.setState(QgsDataItem.Populated)  # make it non-expandable
             else:
-                item = MerginLocalProjectItem(self, project, self.project_manager)
+                item = MerginLocalProjectItem(self, project, self.project_manager, local_proj_path)
             sip.transferto(item, self)
             items.append(item)
+        if error is not None:
+            # failed to fetch another page, keep the projects listed so far and let the user try again
+            items += error
         self.set_fetch_more_item()
         if self.fetch_more_item is not None:
             items.append(self.fetch_more_item)
@@ -933,6 +1183,8 @@ class MerginRootItem(QgsDataCollectionItem):
         return items
 
     def createChildrenGroups(self):
+        # refresh() of each group fetches its projects in a separate QGIS browser worker thread, so the requests
+        # for the groups run in parallel and the project items are created in the groups' own populate tasks
         items = []
         my_projects = MerginGroupItem(self, "My projects", "created", "user.svg", 1, self.plugin)
         my_projects.setState(QgsDataItem.Populated)
@@ -980,7 +1232,7 @@ class MerginRootItem(QgsDataCollectionItem):
             sip.transferto(error_item, self)
             return [error_item]
         except Exception as err:
-            error_item = QgsErrorItem(self, "Error: {}".format(str(err)), "/Mergin/error")
+            error_item = QgsErrorItem(self, f"Error: {str(err)}", "/Mergin/error")
             sip.transferto(error_item, self)
             return [error_item]
         return None
@@ -1007,17 +1259,62 @@ class MerginRootItem(QgsDataCollectionItem):
         if self.fetch_more_item is None:
             QMessageBox.information(None, "Fetch Mergin Maps Projects", "All projects already listed.")
             return
-        page_to_get = floor(self.rowCount() / PROJS_PER_PAGE) + 1
-        dummy = self.fetch_projects(page=page_to_get)
+        # the next page is fetched when the children are re-created, i.e. outside of the main thread
+        self.page_to_fetch = floor(self.rowCount() / PROJS_PER_PAGE) + 1
         self.refresh()
 
     def reload(self):
+        self.plugin.invalidate_user_info()
         if not self.plugin.current_workspace:
             self.plugin.choose_active_workspace()
 
+        clear_local_project_paths_cache()
         self.projects = []
+        self.page_to_fetch = None
         self.refresh()
 
+    def refresh_projects(self):
+        """
+        Re-create project items from the already fetched projects, e.g. after a project was downloaded or removed
+        locally. No request to the server is made.
+        """
+        if self.mc is not None and self.mc.server_type() == ServerType.OLD and not isinstance(self, MerginGroupItem):
+            for group in self.project_manager.get_mergin_browser_groups().values():
+                group.refresh()
+            return
+        self.refresh()
+
+    def project_removed(self, item):
+        """
+        Remove item of a project deleted from the server. If all the projects are listed, this is done without
+        fetching the projects again. Otherwise the server's page offsets have shifted, so the pages fetched
+        by fetch_more() would not follow the listed projects anymore and the list is reloaded.
+        """
+        if self.fetch_more_item is not None:
+            self.reload()
+            return
+        if item.project in self.projects:
+            self.projects.remove(item.project)
+        if self.total_projects_count:
+            self.total_projects_count -= 1
+        if isinstance(self, MerginGroupItem):
+            self.setName(f"{self.base_name} ({self.total_projects_count})")
+        if not self.projects:
+            # let the item fetch the projects again and offer creating a new project if there are none
+            self.refresh()
+            return
+        self.deleteChildItem(item)
+
+    def project_cloned(self, namespace):
+        """Reload only the item which lists projects of the namespace the project was cloned to."""
+        if self.mc.server_type() == ServerType.OLD:
+            # cloned project is always created by the user, so it is listed in My projects group
+            group = self.project_manager.get_mergin_browser_groups().get("My projects")
+            if group is not None:
+                group.reload()
+        elif namespace == self.plugin.current_workspace.get("name", None):
+            self.reload()
+
     def new_project(self):
         """Start the Create new project wizard"""
         self.plugin.create_new_project()
@@ -1025,42 +1322,37 @@ class MerginRootItem(QgsDataCollectionItem):
     def configure(self):
         self.plugin.configure()
 
+    def cached_action(self, icon_name, text, callback):
+        """
+        Get item action with the given icon and text. Actions are created on the first use and then reused,
+        they are not parented to the context menu so they are not deleted together with it.
+        """
+        action = self.item_actions.get(text)
+        if action is None:
+            action = QAction(cached_icon(icon_path(icon_name)), text, None)
+            action.triggered.connect(callback)
+            self.item_actions[text] = action
+        return action
+
     def actions(self, parent):
-        action_configure = QAction(QIcon(icon_path("settings.svg")), "Configure", parent)
-        action_configure.triggered.connect(self.plugin.configure)
-
-        action_refresh = QAction(QIcon(icon_path("repeat.svg")), "Refresh", parent)
-        action_refresh.triggered.connect(self.reload)
-
-        action_create = QAction(QIcon(icon_path("square-plus.svg")), "Create new project", parent)
-        action_create.triggered.connect(self.new_project)
-
-        action_find = QAction(QIcon(icon_path("search.svg")), "Find project", parent)
-        action_find.triggered.connect(self.plugin.find_project)
-
-        action_switch = QAction(QIcon(icon_path("replace.svg")), "Switch workspace", parent)
-        action_switch.triggered.connect(self.plugin.switch_workspace)
-
-        action_explore = QAction(QIcon(icon_path("explore.svg")), "Explore public projects", parent)
-        action_explore.triggered.connect(self.plugin.explore_public_projects)
-
-        actions = [action_configure]
-        if self.mc:
-            server_type = self.mc.server_type()
-            if server_type == ServerType.OLD:
-                actions.append(action_create)
-                actions.append(action_explore)
-            elif server_type == ServerType.CE:
-                actions.append(action_refresh)
-                actions.append(action_create)
-                actions.append(action_find)
-                actions.append(action_explore)
-            elif server_type in (ServerType.EE, ServerType.SAAS):
-                actions.append(action_refresh)
-                actions.append(action_create)
-                actions.append(action_find)
-                actions.append(action_switch)
-                actions.append(action_explore)
+        # only the actions shown for the current server type are created
+        actions = [self.cached_action("settings.svg", "Configure", self.plugin.configure)]
+        if not self.mc:
+            return actions
+        server_type = self.mc.server_type()
+        if server_type not in (ServerType.OLD, ServerType.CE, ServerType.EE, ServerType.SAAS):
+            return actions
+
+        if server_type != ServerType.OLD:
+            actions.append(self.cached_action("repeat.svg", "Refresh", self.reload))
+        actions.append(self.cached_action("square-plus.svg", "Create new project", self.new_project))
+        if server_type != ServerType.OLD:
+            actions.append(self.cached_action("search.svg", "Find project", self.plugin.find_project))
+        if server_type in (ServerType.EE, ServerType.SAAS):
+            actions.append(self.cached_action("replace.svg", "Switch workspace", self.plugin.switch_workspace))
+        actions.append(
+            self.cached_action("explore.svg", "Explore public projects", self.plugin.explore_public_projects)
+        )
         return actions
 
 
@@ -1068,7 +1360,8 @@ class MerginGroupItem(MerginRootItem):
     """Mergin group data item. Contains filtered list of Mergin Maps projects."""
 
     def __init__(self, parent, grp_name, grp_filter, icon, order, plugin):
-        MerginRootItem.__init__(self, parent, grp_name, grp_filter, icon, order, plugin)
+        MerginRootItem.__init__(self, parent, grp_name, grp_filter, order, plugin)
+        self.setIcon(cached_icon(icon_path(icon)))
 
     def isMerginGroupItem(self):
         return True
@@ -1077,17 +1370,11 @@ class MerginGroupItem(MerginRootItem):
         return self.createChildrenProjects()
 
     def actions(self, parent):
-        action_refresh = QAction(QIcon(icon_path("repeat.svg")), "Reload", parent)
-        action_refresh.triggered.connect(self.reload)
-        actions = [action_refresh]
+        actions = [self.cached_action("repeat.svg", "Reload", self.reload)]
         if self.fetch_more_item is not None:
-            action_fetch_more = QAction(QIcon(icon_path("dots.svg")), "Fetch more", parent)
-            action_fetch_more.triggered.connect(self.fetch_more)
-            actions.append(action_fetch_more)
+            actions.append(self.cached_action("dots.svg", "Fetch more", self.fetch_more))
         if self.name().startswith("My projects"):
-            action_create = QAction(QIcon(icon_path("square-plus.svg")), "Create new project", parent)
-            action_create.triggered.connect(self.new_project)
-            actions.append(action_create)
+            actions.append(self.cached_action("square-plus.svg", "Create new project", self.new_project))
         return actions
 
 
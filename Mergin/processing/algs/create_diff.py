@@ -1,17 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import os
-import sqlite3
-import shutil
 
-from qgis.PyQt.QtGui import QIcon
 from qgis.core import (
     QgsFeatureSink,
-    QgsProcessing,
     QgsProcessingUtils,
     QgsProcessingException,
     QgsProcessingAlgorithm,
-    QgsProcessingContext,
     QgsProcessingParameterFile,
     QgsProcessingParameterNumber,
     QgsProcessingParameterVectorLayer,
@@ -21,15 +16,25 @@ from qgis.core import (
 from ..postprocessors import StylingPostProcessor
 
 from ...mergin.merginproject import MerginProject
-from ...mergin.utils import get_versions_with_file_changes
 from ...mergin.deps import pygeodiff
 
-from ...diff import parse_db_schema, parse_diff, get_table_name, create_field_list, diff_table_to_features
+from ...diff import (
+    parse_db_schema,
+    parse_diff,
+    get_table_name,
+    create_field_list,
+    diff_table_to_features,
+    connect_db_for_reading,
+    batched_features,
+)
 
 from ...utils import (
+    cached_icon,
     mm_symbol_path,
-    create_mergin_client,
+    shared_mergin_client,
     check_mergin_subdirs,
+    is_inside_dir,
+    compare_versions,
 )
 
 
@@ -61,7 +66,7 @@ class CreateDiff(QgsProcessingAlgorithm):
         return "Extracts changes made between two versions of the layer of the Mergin Maps project to make it easier to revise changes."
 
     def icon(self):
-        return QIcon(mm_symbol_path())
+        return cached_icon(mm_symbol_path())
 
     def __init__(self):
         super().__init__()
@@ -93,7 +98,7 @@ class CreateDiff(QgsProcessingAlgorithm):
         if not check_mergin_subdirs(project_dir):
             raise QgsProcessingException("Selected directory does not contain a valid Mergin project.")
 
-        if not os.path.normpath(layer.source()).lower().startswith(os.path.normpath(project_dir).lower()):
+        if not is_inside_dir(layer.source().split("|")[0], project_dir):
             raise QgsProcessingException("Selected layer does not belong to the selected Mergin project.")
 
         if layer.dataProvider().storageType() != "GPKG":
@@ -109,12 +114,21 @@ class CreateDiff(QgsProcessingAlgorithm):
         layer_path = layer.source().split("|")[0]
         file_name = os.path.split(layer_path)[1]
 
-        mc = create_mergin_client()
+        mc = shared_mergin_client()
         mp = MerginProject(project_dir)
 
-        feedback.pushInfo("Downloading base file…")
-        base_file = QgsProcessingUtils.generateTempFilename(file_name)
-        mc.download_file(project_dir, file_name, base_file, f"v{end}" if end else None)
+        # base file is only needed to get the table schema. Diff can only be created for a version range without
+        # schema changes, so if the locally synced version is within the range, we can read the schema from the copy
+        # of the file in the .mergin directory instead of downloading it
+        local_version = mp.version()
+        local_version_in_range = compare_versions(local_version, f"v{start}") >= 0 and (
+            not end or compare_versions(local_version, f"v{end}") <= 0
+        )
+        base_file = mp.fpath_meta(file_name)
+        if not local_version_in_range or not os.path.exists(base_file):
+            feedback.pushInfo("Downloading base file…")
+            base_file = QgsProcessingUtils.generateTempFilename(file_name)
+            mc.download_file(project_dir, file_name, base_file, f"v{end}" if end else None)
         feedback.setProgress(10)
 
         diff_file = QgsProcessingUtils.generateTempFilename(file_name + ".diff")
@@ -144,22 +158,23 @@ class CreateDiff(QgsProcessingAlgorithm):
         feedback.setProgress(30)
 
         if diff and table_name in diff.keys():
-            db_conn = None  # no ref. db
-            db_conn = sqlite3.connect(layer_path)
+            db_conn = connect_db_for_reading(layer_path)
             features = diff_table_to_features(diff[table_name], db_schema[table_name], fields, fields_mapping, db_conn)
             feedback.setProgress(40)
 
-            current = 40
-            step = 60.0 / len(features) if features else 0
-            for i, f in enumerate(features):
+            # features are created lazily and added in batches, adding them one by one is slow for large diffs
+            step = 60.0 / len(diff[table_name]) if diff[table_name] else 0
+            count = 0
+            for batch in batched_features(features):
                 if feedback.isCanceled():
                     break
-                sink.addFeature(f, QgsFeatureSink.FastInsert)
-                feedback.setProgress(int(i * step))
+                sink.addFeatures(batch, QgsFeatureSink.FastInsert)
+                count += len(batch)
+                feedback.setProgress(40 + int(count * step))
 
         if context.willLoadLayerOnCompletion(dest_id):
             context.layerToLoadOnCompletionDetails(dest_id).setPostProcessor(
-                StylingPostProcessor.create(db_schema[table_name])
+                StylingPostProcessor.create(db_schema[table_name], dest_id)
             )
 
         return {self.OUTPUT: dest_id}
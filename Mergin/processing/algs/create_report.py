@@ -1,9 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from qgis.PyQt.QtGui import QIcon
 from qgis.core import (
-    QgsVectorFileWriter,
-    QgsProcessing,
     QgsProcessingException,
     QgsProcessingAlgorithm,
     QgsProcessingContext,
@@ -12,7 +9,7 @@ from qgis.core import (
     QgsProcessingParameterFileDestination,
 )
 
-from ...utils import mm_symbol_path, create_mergin_client, create_report, ClientError, InvalidProject
+from ...utils import cached_icon, mm_symbol_path, shared_mergin_client, create_report, ClientError, InvalidProject
 
 
 class CreateReport(QgsProcessingAlgorithm):
@@ -40,7 +37,7 @@ class CreateReport(QgsProcessingAlgorithm):
         return "Exports changesets aggregates for Mergin Maps projects in given version range to a CSV file."
 
     def icon(self):
-        return QIcon(mm_symbol_path())
+        return cached_icon(mm_symbol_path())
 
     def __init__(self):
         super().__init__()
@@ -73,7 +70,7 @@ class CreateReport(QgsProcessingAlgorithm):
             end = ""
         output_file = self.parameterAsFileOutput(parameters, self.REPORT, context)
 
-        mc = create_mergin_client()
+        mc = shared_mergin_client()
         warnings = None
         try:
             warnings = create_report(mc, project_dir, f"v{start}", f"v{end}" if end else "", output_file)
@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 
 import os
-import zlib
-import math
+import gzip
 import sqlite3
+from itertools import product
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtCore import QUrl
 from qgis.PyQt.QtNetwork import QNetworkRequest
 from qgis.PyQt.QtXml import QDomDocument
@@ -14,7 +14,6 @@ from qgis.core import (
     QgsCsException,
     QgsCoordinateReferenceSystem,
     QgsBlockingNetworkRequest,
-    QgsSqliteUtils,
     QgsDataSourceUri,
     QgsVectorTileLayer,
     QgsCoordinateTransform,
@@ -29,7 +28,10 @@ from qgis.core import (
     QgsTileXYZ,
 )
 
-from ...utils import mm_symbol_path
+from ...utils import cached_icon, mm_symbol_path
+
+# number of tiles downloaded in parallel, kept low to not overload tile servers
+DOWNLOAD_THREADS = 8
 
 
 class MBTilesWriter:
@@ -62,20 +64,27 @@ class MBTilesWriter:
             return
 
         params = (key, value)
-        cur = self.conn.cursor()
-        cur.execute("insert into metadata values (?, ?)", params)
-        self.conn.commit()
+        self.conn.execute("insert into metadata values (?, ?)", params)
 
     def set_tile_data(self, z, x, y, data):
+        """
+        Inserts tile data. Like metadata, tiles are written in a single transaction until commit() is called,
+        committing every tile would sync the file to disk after each insert.
+        """
         if self.conn is None:
             return
 
         params = (z, x, y, data)
-        cur = self.conn.cursor()
-        cur.execute("insert into tiles values (?, ?, ?, ?)", params)
+        self.conn.execute("insert into tiles values (?, ?, ?, ?)", params)
+
+    def commit(self):
+        if self.conn is None:
+            return
+
         self.conn.commit()
 
     def close(self):
+        self.conn.commit()
         self.conn.close()
 
 
@@ -105,7 +114,7 @@ class DownloadVectorTiles(QgsProcessingAlgorithm):
         return "Downloads vector tiles of the input vector tile layer and saves them in the local vector tile file."
 
     def icon(self):
-        return QIcon(mm_symbol_path())
+        return cached_icon(mm_symbol_path())
 
     def __init__(self):
         super().__init__()
@@ -141,6 +150,13 @@ class DownloadVectorTiles(QgsProcessingAlgorithm):
         ds_uri = QgsDataSourceUri()
         ds_uri.setEncodedUri(layer.source())
         self.url = ds_uri.param("url")
+        self.url_reversed_y = "{-y}" in self.url
+        # turn URL template into a format string once, so that formatting tile URL is a single call per tile.
+        # Other braces in the URL are escaped to be kept as they are, like when the placeholders were replaced
+        y_placeholder = "{{-y}}" if self.url_reversed_y else "{{y}}"
+        self.url_format = self.url.replace("{", "{{").replace("}", "}}")
+        for placeholder, field in (("{{x}}", "{x}"), (y_placeholder, "{y}"), ("{{z}}", "{z}")):
+            self.url_format = self.url_format.replace(placeholder, field)
 
         self.tile_matrix_set = layer.tileMatrixSet()
         self.source_min_zoom = layer.sourceMinZoom()
@@ -169,8 +185,11 @@ class DownloadVectorTiles(QgsProcessingAlgorithm):
 
         tile_count = 0
         tile_ranges = dict()
+        # matrix heights are needed for formatting tile URLs, get them once per zoom level instead of once per tile
+        self.matrix_heights = dict()
         for i in range(self.max_zoom + 1):
             tile_matrix = self.tile_matrix_set.tileMatrix(i)
+            self.matrix_heights[i] = tile_matrix.matrixHeight()
             tile_range = tile_matrix.tileRangeFromExtent(self.extent)
             tile_ranges[i] = tile_range
             tile_count += (tile_range.endColumn() - tile_range.startColumn() + 1) * (
@@ -203,54 +222,48 @@ class DownloadVectorTiles(QgsProcessingAlgorithm):
                 f"{wgs_extent.xMinimum()},{wgs_extent.yMinimum()},{wgs_extent.xMaximum()},{wgs_extent.yMaximum()}"
             )
             writer.set_metadata_value("bounds", bounds_str)
-        except QgsCsException as e:
+        except QgsCsException:
             pass
 
         step_feedback = QgsProcessingMultiStepFeedback(self.max_zoom + 1, feedback)
-        for zoom, tile_range in tile_ranges.items():
-            if feedback.isCanceled():
-                break
-
-            step_feedback.setCurrentStep(zoom)
-
-            tiles = list()
-            # tilesInRange() provides correct handling of "indexed" vector tile sets in vtpk and arcgis
-            # tile services. This method is not available in old QGIS version, so we use simplified
-            # approach adopted from the C++ code
-            if Qgis.versionInt() >= 33200:
-                tiles = self.tile_matrix_set.tilesInRange(tile_range, zoom)
-            else:
-                for row in range(tile_range.startRow(), tile_range.endRow() + 1):
-                    for column in range(tile_range.startColumn(), tile_range.endColumn() + 1):
-                        if feedback.isCanceled():
-                            break
-                        tile = QgsTileXYZ(column, row, zoom)
-                        tiles.append(tile)
-
-            step = 100 / len(tiles) if len(tiles) > 0 else 0
-            for i, tile in enumerate(tiles):
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_THREADS) as executor:
+            for zoom, tile_range in tile_ranges.items():
                 if feedback.isCanceled():
                     break
 
-                tile_matrix = self.tile_matrix_set.tileMatrix(tile.zoomLevel())
-                url = self.format_url_template(self.url, tile, tile_matrix)
-                nr = QNetworkRequest(QUrl(url))
-
-                req = QgsBlockingNetworkRequest()
-                res = req.get(nr, False, feedback)
-                if res == QgsBlockingNetworkRequest.NoError:
-                    data = req.reply().content()
-
-                    comp_obj = zlib.compressobj(
-                        zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, zlib.MAX_WBITS + 16, 8, zlib.Z_DEFAULT_STRATEGY
-                    )
-                    gzip_data = comp_obj.compress(data)
-                    gzip_data += comp_obj.flush()
-                    row_tms = math.pow(2, tile.zoomLevel()) - tile.row() - 1
-                    writer.set_tile_data(tile.zoomLevel(), tile.column(), row_tms, gzip_data)
-
-                step_feedback.setProgress(i * step)
-
+                step_feedback.setCurrentStep(zoom)
+
+                # tilesInRange() provides correct handling of "indexed" vector tile sets in vtpk and arcgis
+                # tile services. This method is not available in old QGIS version, so we use simplified
+                # approach adopted from the C++ code
+                if Qgis.versionInt() >= 33200:
+                    tiles = self.tile_matrix_set.tilesInRange(tile_range, zoom)
+                else:
+                    rows = range(tile_range.startRow(), tile_range.endRow() + 1)
+                    columns = range(tile_range.startColumn(), tile_range.endColumn() + 1)
+                    tiles = [QgsTileXYZ(column, row, zoom) for row, column in product(rows, columns)]
+
+                step = 100 / len(tiles) if len(tiles) > 0 else 0
+                # tiles are independent, download them in parallel to not wait for each request round-trip in turn
+                futures = [executor.submit(self.download_tile, tile, feedback) for tile in tiles]
+                for i, future in enumerate(as_completed(futures)):
+                    if feedback.isCanceled():
+                        for f in futures:
+                            f.cancel()
+                        break
+
+                    tile, gzip_data = future.result()
+                    if gzip_data is not None:
+                        # indexed tile sets may return tiles from lower zoom levels, so use the tile's own zoom level
+                        row_tms = (1 << tile.zoomLevel()) - tile.row() - 1
+                        writer.set_tile_data(tile.zoomLevel(), tile.column(), row_tms, gzip_data)
+
+                    step_feedback.setProgress(i * step)
+
+                # store downloaded tiles once per zoom level
+                writer.commit()
+
+        writer.close()
         self.output_file_path = output_file
         return {self.OUTPUT: output_file}
 
@@ -270,11 +283,28 @@ class DownloadVectorTiles(QgsProcessingAlgorithm):
                 context.project().addMapLayer(tile_layer)
         return {self.OUTPUT: self.output_file_path}
 
-    def format_url_template(self, url, tile, tile_matrix):
-        out_url = url.replace("{x}", f"{tile.column()}")
-        if "{-y}" in out_url:
-            out_url = out_url.replace("{-y}", f"{tile_matrix.matrixHeight() - tile.row() - 1}")
+    def download_tile(self, tile, feedback):
+        """
+        Downloads a single tile, called from the worker threads. Returns tuple with the tile
+        and gzip compressed tile data, the data is None if the request failed.
+        """
+        url = self.format_url_template(tile)
+        nr = QNetworkRequest(QUrl(url))
+        # tiles are requested from the same server, let Qt multiplex the requests over a single connection
+        nr.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+
+        req = QgsBlockingNetworkRequest()
+        res = req.get(nr, False, feedback)
+        if res != QgsBlockingNetworkRequest.NoError:
+            return tile, None
+
+        # level 6 is zlib's default compression level, gzip module would use 9 otherwise
+        gzip_data = gzip.compress(req.reply().content(), compresslevel=6)
+        return tile, gzip_data
+
+    def format_url_template(self, tile):
+        if self.url_reversed_y:
+            y = self.matrix_heights[tile.zoomLevel()] - tile.row() - 1
         else:
-            out_url = out_url.replace("{y}", f"{tile.row()}")
-        out_url = out_url.replace("{z}", f"{tile.zoomLevel()}")
-        return out_url
+            y = tile.row()
+        return self.url_format.format(x=tile.column(), y=y, z=tile.zoomLevel())
@@ -1,15 +1,9 @@
 # -*- coding: utf-8 -*-
 
-import os
-import sqlite3
-
-from qgis.PyQt.QtGui import QIcon
 from qgis.core import (
     QgsFeatureSink,
-    QgsProcessing,
     QgsProcessingException,
     QgsProcessingAlgorithm,
-    QgsProcessingContext,
     QgsProcessingParameterFile,
     QgsProcessingParameterVectorLayer,
     QgsProcessingParameterFeatureSink,
@@ -26,11 +20,15 @@ from ...diff import (
     get_table_name,
     create_field_list,
     diff_table_to_features,
+    connect_db_for_reading,
+    batched_features,
 )
 
 from ...utils import (
+    cached_icon,
     mm_symbol_path,
     check_mergin_subdirs,
+    is_inside_dir,
 )
 
 
@@ -60,7 +58,7 @@ class ExtractLocalChanges(QgsProcessingAlgorithm):
         return "Extracts local changes made in the specific layer of the Mergin Maps project to make it easier to revise changes."
 
     def icon(self):
-        return QIcon(mm_symbol_path())
+        return cached_icon(mm_symbol_path())
 
     def __init__(self):
         super().__init__()
@@ -82,7 +80,7 @@ class ExtractLocalChanges(QgsProcessingAlgorithm):
         if not check_mergin_subdirs(project_dir):
             raise QgsProcessingException("Selected directory does not contain a valid Mergin project.")
 
-        if not os.path.normpath(layer.source()).lower().startswith(os.path.normpath(project_dir).lower()):
+        if not is_inside_dir(layer.source().split("|")[0], project_dir):
             raise QgsProcessingException("Selected layer does not belong to the selected Mergin project.")
 
         if layer.dataProvider().storageType() != "GPKG":
@@ -113,22 +111,23 @@ class ExtractLocalChanges(QgsProcessingAlgorithm):
         feedback.setProgress(15)
 
         if diff and table_name in diff.keys():
-            db_conn = None  # no ref. db
-            db_conn = sqlite3.connect(layer_path)
+            db_conn = connect_db_for_reading(layer_path)
             features = diff_table_to_features(diff[table_name], db_schema[table_name], fields, fields_mapping, db_conn)
             feedback.setProgress(20)
 
-            current = 20
-            step = 80.0 / len(features) if features else 0
-            for i, f in enumerate(features):
+            # features are created lazily and added in batches, adding them one by one is slow for large diffs
+            step = 80.0 / len(diff[table_name]) if diff[table_name] else 0
+            count = 0
+            for batch in batched_features(features):
                 if feedback.isCanceled():
                     break
-                sink.addFeature(f, QgsFeatureSink.FastInsert)
-                feedback.setProgress(int(i * step))
+                sink.addFeatures(batch, QgsFeatureSink.FastInsert)
+                count += len(batch)
+                feedback.setProgress(20 + int(count * step))
 
         if context.willLoadLayerOnCompletion(dest_id):
             context.layerToLoadOnCompletionDetails(dest_id).setPostProcessor(
-                StylingPostProcessor.create(db_schema[table_name])
+                StylingPostProcessor.create(db_schema[table_name], dest_id)
             )
 
         return {self.OUTPUT: dest_id}
@@ -4,18 +4,22 @@ from ..diff import style_diff_layer
 
 
 class StylingPostProcessor(QgsProcessingLayerPostProcessorInterface):
-    instance = None
+    instances = {}
 
-    def __init__(self, table_schema):
+    def __init__(self, table_schema, key=None):
         super().__init__()
         self.table_schema = table_schema
+        self.key = key
 
     def postProcessLayer(self, layer, context, feedback):
         style_diff_layer(layer, self.table_schema)
         layer.triggerRepaint()
+        # post processor is run just once, it does not need to be kept alive anymore
+        StylingPostProcessor.instances.pop(self.key, None)
 
-    # Hack to work around sip bug!
+    # Hack to work around sip bug! Post processor has to be kept alive on Python side, instances are
+    # kept per output layer so that algorithms running in parallel do not replace each other's instance
     @staticmethod
-    def create(table_schema):
-        StylingPostProcessor.instance = StylingPostProcessor(table_schema)
-        return StylingPostProcessor.instance
+    def create(table_schema, key):
+        StylingPostProcessor.instances[key] = StylingPostProcessor(table_schema, key)
+        return StylingPostProcessor.instances[key]
@@ -1,12 +1,8 @@
 # -*- coding: utf-8 -*-
 
-import os
-
-from qgis.PyQt.QtGui import QIcon
-
 from qgis.core import QgsProcessingProvider
 
-from ..utils import mm_symbol_path
+from ..utils import cached_icon, mm_symbol_path
 from .algs.create_report import CreateReport
 from .algs.extract_local_changes import ExtractLocalChanges
 from .algs.create_diff import CreateDiff
@@ -25,7 +21,7 @@ class MerginProvider(QgsProcessingProvider):
         return "Mergin Maps"
 
     def icon(self):
-        return QIcon(mm_symbol_path())
+        return cached_icon(mm_symbol_path())
 
     def load(self):
         self.refreshAlgorithms()
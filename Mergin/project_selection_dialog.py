@@ -1,5 +1,4 @@
 import os
-import posixpath
 from enum import Enum, auto
 from urllib.error import URLError
 from qgis.PyQt.QtWidgets import QDialog, QAbstractItemDelegate, QStyle
@@ -15,10 +14,11 @@ from qgis.PyQt.QtCore import (
     QThread,
 )
 from qgis.PyQt import uic
-from qgis.PyQt.QtGui import QPixmap, QFont, QFontMetrics, QIcon, QStandardItem, QStandardItemModel
+from qgis.PyQt.QtGui import QPixmap, QFont, QFontMetrics, QStandardItem, QStandardItemModel
 
 from .mergin.client import MerginProject, InvalidProject, ServerType
 from .utils import (
+    cached_icon,
     icon_path,
     mm_logo_path,
     mergin_project_local_path,
@@ -28,6 +28,9 @@ from .utils import (
 
 ui_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "ui_select_project_dialog.ui")
 
+# fraction of the project list scrolled through after which the next page is requested
+NEXT_PAGE_SCROLL_THRESHOLD = 0.7
+
 
 class SyncStatus(Enum):
     UP_TO_DATE = auto()
@@ -47,20 +50,26 @@ class ProjectsModel(QStandardItemModel):
 
     def __init__(self, projects=None):
         super(ProjectsModel, self).__init__()
+        # sync status of already listed projects, key: tuple (project full name, server version), value: SyncStatus.
+        # Getting the status means checking local changes and the same projects are listed again on every search
+        self.status_cache = dict()
         if projects:
             self.appendProjects(projects)
 
     def appendProjects(self, projects):
-        for item in self.createItems(projects):
-            self.appendRow(item)
+        # append the whole page at once, so that the view is notified about inserted rows only once
+        self.invisibleRootItem().appendRows(self.createItems(projects))
 
-    @staticmethod
-    def createItems(projects):
+    def createItems(self, projects):
         items = []
         for project in projects:
             item = QStandardItem(project["name"])
 
-            status = ProjectsModel.status(project)
+            name_with_namespace = f"{project['namespace']}/{project['name']}"
+            status_key = (name_with_namespace, project["version"])
+            status = self.status_cache.get(status_key)
+            if status is None:
+                status = self.status_cache[status_key] = ProjectsModel.status(project)
             if status == SyncStatus.NOT_DOWNLOADED:
                 status_string = "Not downloaded"
             elif status == SyncStatus.LOCAL_CHANGES:
@@ -76,7 +85,6 @@ class ProjectsModel(QStandardItemModel):
             elif status in (SyncStatus.LOCAL_CHANGES, SyncStatus.REMOTE_CHANGES):
                 icon = "refresh.svg"
 
-            name_with_namespace = f"{project['namespace']}/{project['name']}"
             item.setData(name_with_namespace, Qt.DisplayRole)
             item.setData(name_with_namespace, ProjectsModel.NAME_WITH_NAMESPACE)
             item.setData(project, ProjectsModel.PROJECT)
@@ -90,13 +98,13 @@ class ProjectsModel(QStandardItemModel):
 
     @staticmethod
     def localProjectPath(project):
-        project_name = posixpath.join(project["namespace"], project["name"])  # posix path for server API calls
+        project_name = f"{project['namespace']}/{project['name']}"  # posix path for server API calls
         return mergin_project_local_path(project_name)
 
     @staticmethod
     def status(project):
         local_proj_path = ProjectsModel.localProjectPath(project)
-        if local_proj_path is None or not os.path.exists(local_proj_path):
+        if local_proj_path is None or not os.path.isdir(local_proj_path):
             return SyncStatus.NOT_DOWNLOADED
 
         try:
@@ -160,7 +168,7 @@ class ProjectItemDelegate(QAbstractItemDelegate):
         painter.drawText(infoRect, Qt.AlignLeading, elided_status)
         icon = index.data(ProjectsModel.ICON)
         if icon:
-            icon = QIcon(icon_path(icon))
+            icon = cached_icon(icon_path(icon))
             icon.paint(painter, iconRect)
         painter.restore()
 
@@ -239,6 +247,8 @@ class ProjectSelectionDialog(QDialog):
         self.text_change_timer.setInterval(500)
         self.text_change_timer.timeout.connect(self.fetch_from_server)
         self.fetcher = None
+        # replaced fetchers are kept until their threads finish, a QThread must not be destroyed while running
+        self.interrupted_fetchers = []
 
         self.model = ProjectsModel()
         self.proxy = QSortFilterProxyModel()
@@ -271,10 +281,13 @@ class ProjectSelectionDialog(QDialog):
             self.request_page = 1
             self.ui.project_list.clearSelection()
             self.ui.project_list.scrollToTop()
-            self.model.clear()
+            # remove rows instead of resetting the model, nothing needs to be done when no projects were listed yet
+            if self.model.rowCount() > 0:
+                self.model.removeRows(0, self.model.rowCount())
             self.fetched_projects_number = 0
             self.total_projects_number = 0
 
+        self.interrupted_fetchers = [f for f in self.interrupted_fetchers if f.isRunning()]
         if self.fetcher and self.fetcher.isRunning():
             if fetch_next_page and self.fetcher.isFetchingNextPage():
                 # We only want one fetch_next_page request at a time
@@ -282,6 +295,7 @@ class ProjectSelectionDialog(QDialog):
             else:
                 # Let's replace the existing request with the new one
                 self.fetcher.requestInterruption()
+                self.interrupted_fetchers.append(self.fetcher)
                 self.ui.line_edit.setShowSpinner(False)
 
         self.current_search_term = self.ui.line_edit.text()
@@ -309,7 +323,8 @@ class ProjectSelectionDialog(QDialog):
         if not self.need_to_fetch_next_page:
             return
 
-        if self.ui.project_list.verticalScrollBar().maximum() <= value:
+        # request the next page before the end of the list is reached, so that it is loaded while the user scrolls
+        if self.ui.project_list.verticalScrollBar().maximum() * NEXT_PAGE_SCROLL_THRESHOLD <= value:
             self.fetch_from_server(fetch_next_page=True)
 
     def on_text_changed(self, text):
@@ -1,7 +1,6 @@
 import json
 import os
 from qgis.PyQt import uic
-from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtWidgets import QFileDialog, QMessageBox
 from qgis.core import (
@@ -16,6 +15,7 @@ from qgis.core import (
 from qgis.gui import QgsOptionsWidgetFactory, QgsOptionsPageWidget
 from .attachment_fields_model import AttachmentFieldsModel
 from .utils import (
+    cached_icon,
     mm_symbol_path,
     mergin_project_local_path,
     prefix_for_relative_path,
@@ -33,7 +33,7 @@ class MerginProjectConfigFactory(QgsOptionsWidgetFactory):
         QgsOptionsWidgetFactory.__init__(self)
 
     def icon(self):
-        return QIcon(mm_symbol_path())
+        return cached_icon(mm_symbol_path())
 
     def title(self):
         return "Mergin Maps"
@@ -214,17 +214,19 @@ class ProjectConfigWidget(ProjectConfigUiWidget, QgsOptionsPageWidget):
             return
 
         # check if tracking layer already exists
-        tracking_layer_id, ok = QgsProject.instance().readEntry("Mergin", "PositionTracking/TrackingLayer")
-        if tracking_layer_id != "" and tracking_layer_id in QgsProject.instance().mapLayers():
+        project = QgsProject.instance()
+        tracking_layer_id, ok = project.readEntry("Mergin", "PositionTracking/TrackingLayer")
+        # look up the single layer instead of building the map of all project layers
+        layer = project.mapLayer(tracking_layer_id) if tracking_layer_id != "" else None
+        if layer is not None:
             # tracking layer already exists in the project, make sure it has correct flags
-            layer = QgsProject.instance().mapLayers()[tracking_layer_id]
-            if layer is not None and layer.isValid():
+            if layer.isValid():
                 set_tracking_layer_flags(layer)
             return
 
         # tracking layer does not exists or was removed from the project
         # create a new layer and add it as a tracking layer
-        create_tracking_layer(QgsProject.instance().absolutePath())
+        create_tracking_layer(project.absolutePath())
 
     def apply(self):
         QgsProject.instance().writeEntry("Mergin", "PhotoQuality", self.cmb_photo_quality.currentData())
@@ -12,13 +12,20 @@ from qgis.PyQt.QtWidgets import (
     QMessageBox,
 )
 from qgis.PyQt.QtCore import Qt
-from qgis.PyQt.QtGui import QStandardItemModel, QStandardItem, QIcon
+from qgis.PyQt.QtGui import QStandardItemModel, QStandardItem
 from qgis.gui import QgsGui
-from qgis.core import Qgis, QgsApplication, QgsProject
+from qgis.core import Qgis, QgsProject
 from qgis.utils import OverrideCursor
 from .diff_dialog import DiffViewerDialog
 from .validation import MultipleLayersWarning, warning_display_string, MerginProjectValidator, SingleLayerWarning
-from .utils import is_versioned_file, icon_path, unsaved_project_check, UnsavedChangesStrategy
+from .utils import (
+    is_versioned_file,
+    icon_path,
+    cached_icon,
+    message_log,
+    unsaved_project_check,
+    UnsavedChangesStrategy,
+)
 from .repair import fix_datum_shift_grids
 
 
@@ -57,12 +64,12 @@ class ProjectStatusDialog(QDialog):
             QgsGui.instance().enableAutoGeometryRestore(self)
 
             self.btn_sync = QPushButton("Sync")
-            self.btn_sync.setIcon(QIcon(icon_path("refresh.svg")))
+            self.btn_sync.setIcon(cached_icon(icon_path("refresh.svg")))
             # add sync button with AcceptRole. If dialog accepted we will start
             # sync, otherwise just close status dialog
             self.ui.buttonBox.addButton(self.btn_sync, QDialogButtonBox.ButtonRole.AcceptRole)
 
-            self.btn_view_changes.setIcon(QIcon(icon_path("file-diff.svg")))
+            self.btn_view_changes.setIcon(cached_icon(icon_path("file-diff.svg")))
             self.btn_view_changes.clicked.connect(self.show_changes)
 
             self.txtWarnings.anchorClicked.connect(self.link_clicked)
@@ -80,7 +87,7 @@ class ProjectStatusDialog(QDialog):
             self.changes_summary = push_changes_summary
 
             has_files_to_replace = any(
-                ["diff" not in file and is_versioned_file(file["path"]) for file in push_changes["updated"]]
+                "diff" not in file and is_versioned_file(file["path"]) for file in push_changes["updated"]
             )
             info_text = self._get_info_text(has_files_to_replace, has_write_permissions, self.mp.has_unfinished_pull())
             for msg in info_text:
@@ -91,7 +98,7 @@ class ProjectStatusDialog(QDialog):
 
             self.validate_project()
 
-            self.btn_reset_local_changes.setIcon(QIcon(icon_path("revert-changes.svg")))
+            self.btn_reset_local_changes.setIcon(cached_icon(icon_path("revert-changes.svg")))
             self.btn_reset_local_changes.clicked.connect(self.reset_local_changes)
 
             if len(push_changes["added"]) > 0 or len(push_changes["removed"]) > 0 or len(push_changes["updated"]) > 0:
@@ -121,7 +128,7 @@ class ProjectStatusDialog(QDialog):
         return msg
 
     def check_any_changes(self, pull_changes, push_changes):
-        if not sum(len(v) for v in list(pull_changes.values()) + list(push_changes.values())):
+        if not (any(pull_changes.values()) or any(push_changes.values())):
             root_item = QStandardItem("No changes")
             self.model.appendRow(root_item)
 
@@ -150,7 +157,7 @@ class ProjectStatusDialog(QDialog):
                     elif not is_server and category != "added":
                         item.appendRow(QStandardItem("Unable to detect changes"))
                         msg = f"Mergin Maps plugin: Unable to detect changes for {path}"
-                        QgsApplication.messageLog().logMessage(msg)
+                        message_log().logMessage(msg)
                         if self.mp is not None:
                             self.mp.log.warning(msg)
                 root_item.appendRow(item)
@@ -169,9 +176,8 @@ class ProjectStatusDialog(QDialog):
         return [QStandardItem("{}: {}".format(k, summary[k])) for k in summary if k != "table"]
 
     def _get_icon_item(self, key, text):
-        path = icon_path(self.icons[key])
         item = QStandardItem(text)
-        item.setIcon(QIcon(path))
+        item.setIcon(cached_icon(icon_path(self.icons[key])))
         return item
 
     def show_validation_results(self, results):
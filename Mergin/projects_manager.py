@@ -1,12 +1,13 @@
 import os
+import shutil
+import time
 from urllib.parse import urlparse
 from pathlib import Path
-import posixpath
 
-from qgis.core import QgsProject, Qgis, QgsApplication
+from qgis.core import QgsProject, Qgis
 from qgis.utils import iface
 from qgis.PyQt.QtWidgets import QMessageBox, QApplication, QPushButton, QFileDialog
-from qgis.PyQt.QtCore import QSettings, Qt, QTimer
+from qgis.PyQt.QtCore import pyqtSignal, Qt, QThread, QTimer
 from urllib.error import URLError
 
 from .sync_dialog import SyncDialog
@@ -16,10 +17,14 @@ from .utils import (
     InvalidProject,
     get_local_mergin_projects_info,
     LoginError,
-    find_qgis_files,
+    clear_qgis_files_cache,
+    find_qgis_files_cached,
     login_error_message,
+    mergin_settings,
+    message_log,
     same_dir,
     send_logs,
+    set_local_project_path,
     unhandled_exception_message,
     unsaved_project_check,
     UnsavedChangesStrategy,
@@ -28,15 +33,72 @@ from .utils import (
 )
 
 from .mergin.merginproject import MerginProject
-from .project_status_dialog import ProjectStatusDialog
+
+
+class ProjectDirRemover(QThread):
+    """
+    Class to handle removal of local project directory in background worker thread
+    """
+
+    removed = pyqtSignal(str, str)
+
+    def __init__(self, project_dir):
+        """
+        ProjectDirRemover constructor
+
+        :param project_dir: local project directory to remove
+        """
+        super(ProjectDirRemover, self).__init__()
+        self.project_dir = project_dir
+
+    def run(self):
+        try:
+            shutil.rmtree(self.project_dir)
+        except OSError as e:
+            self.removed.emit(self.project_dir, str(e))
+            return
+        self.removed.emit(self.project_dir, "")
 
 
 class MerginProjectsManager(object):
     """Class for managing Mergin Maps projects in QGIS."""
 
+    # how long (in seconds) the project info fetched from the server is considered valid
+    PROJECT_INFO_TTL = 5
+
     def __init__(self, mergin_client):
         self.mc = mergin_client
         self.iface = iface
+        # cached project info responses, key: project full name, value: tuple (timestamp, info)
+        self.project_info_cache = dict()
+        # running local project directory removals
+        self.dir_removers = []
+
+    def project_info(self, project_name):
+        """
+        Get project info from the server. The response is cached for a few seconds, so that the actions
+        triggered by a single user request (e.g. status followed by sync) do not fetch it repeatedly.
+        """
+        cached = self.project_info_cache.get(project_name)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.PROJECT_INFO_TTL:
+            return cached[1]
+        info = self.mc.project_info(project_name)
+        self.project_info_cache[project_name] = (now, info)
+        return info
+
+    def invalidate_project_info(self, project_name):
+        """Drop cached project info, e.g. when the project version has changed."""
+        self.project_info_cache.pop(project_name, None)
+
+    def has_writing_permissions(self, project_name, info=None):
+        """
+        Check whether the user can upload changes to the project. If project info was already fetched within
+        the current operation, it can be passed in, otherwise the cached project info is used.
+        """
+        if info is None:
+            info = self.project_info(project_name)
+        return info["permissions"]["upload"]
 
     @staticmethod
     def unsaved_changes_check(project_dir):
@@ -44,7 +106,7 @@ class MerginProjectsManager(object):
         Check if current project is the same as actually operated Mergin project and has some unsaved changes.
         """
         qgis_proj_filename = os.path.normpath(QgsProject.instance().fileName())
-        if qgis_proj_filename in find_qgis_files(project_dir):
+        if qgis_proj_filename in find_qgis_files_cached(project_dir):
             check_result = unsaved_project_check()
             return False if check_result == UnsavedChangesStrategy.HasUnsavedChanges else True
         return True  # not a Mergin project
@@ -53,7 +115,7 @@ class MerginProjectsManager(object):
         if not project_dir:
             return
 
-        qgis_files = find_qgis_files(project_dir)
+        qgis_files = find_qgis_files_cached(project_dir)
         if len(qgis_files) == 1:
             iface.addProject(qgis_files[0])
             if self.mc.has_unfinished_pull(project_dir):
@@ -75,7 +137,7 @@ class MerginProjectsManager(object):
             msg = (
                 "Selected project does not contain any QGIS project file"
                 if len(qgis_files) == 0
-                else "Plugin can only load project with single QGIS project file but {} found.".format(len(qgis_files))
+                else f"Plugin can only load project with single QGIS project file but {len(qgis_files)} found."
             )
             QMessageBox.warning(None, "Load QGIS project", msg, QMessageBox.Close)
 
@@ -85,7 +147,7 @@ class MerginProjectsManager(object):
         If project_dir is None, we are creating empty project without upload.
         """
 
-        full_project_name = "{}/{}".format(namespace, project_name)
+        full_project_name = f"{namespace}/{project_name}"
         QApplication.setOverrideCursor(Qt.WaitCursor)
         try:
             self.mc.create_project(full_project_name, is_public)
@@ -162,14 +224,10 @@ class MerginProjectsManager(object):
             # we were cancelled - but no need to show a message box about that...?
             return True
 
-        settings = QSettings()
         server_url = self.mc.url.rstrip("/")
-        settings.setValue(f"Mergin/localProjects/{full_project_name}/path", project_dir)
-        settings.setValue(f"Mergin/localProjects/{full_project_name}/server", server_url)
-        if (
-            project_dir == QgsProject.instance().absolutePath()
-            or project_dir + "/" in QgsProject.instance().absolutePath()
-        ):
+        set_local_project_path(full_project_name, project_dir, server_url)
+        current_project_path = QgsProject.instance().absolutePath()
+        if project_dir == current_project_path or current_project_path.startswith(project_dir + "/"):
             write_project_variables(self.mc.username(), project_name, full_project_name, "v1", server_url)
 
         QMessageBox.information(
@@ -195,15 +253,19 @@ class MerginProjectsManager(object):
 
         if not self.check_project_server(project_dir):
             return
+
+        from .project_status_dialog import ProjectStatusDialog
+
         try:
             pull_changes, push_changes, push_changes_summary = self.mc.project_status(project_dir)
+            info = self.project_info(project_name)
             dlg = ProjectStatusDialog(
                 pull_changes,
                 push_changes,
                 push_changes_summary,
-                self.mc.has_writing_permissions(project_name),
+                self.has_writing_permissions(project_name, info),
                 mp,
-                self.mc.project_info(project_name)["role"],
+                info["role"],
             )
             # Sync button in the status dialog returns QDialog.Accepted
             # and Close button returns QDialog::Rejected, so if dialog was
@@ -211,7 +273,8 @@ class MerginProjectsManager(object):
             return_value = dlg.exec()
 
             if return_value == ProjectStatusDialog.Accepted:
-                self.sync_project(project_dir)
+                # user may spend some time in the dialog, so pass the project info on instead of fetching it again
+                self.sync_project(project_dir, project_name, info)
             elif return_value == ProjectStatusDialog.RESET_CHANGES:
                 self.reset_local_changes(project_dir, dlg.file_to_reset)
 
@@ -221,6 +284,25 @@ class MerginProjectsManager(object):
         except LoginError as e:
             login_error_message(e)
 
+    def remove_project_dir(self, project_dir, delay=0):
+        """
+        Remove local project directory in background worker thread, so that removal of large projects does not
+        block the GUI. Removal starts after delay (in milliseconds).
+        """
+        remover = ProjectDirRemover(project_dir)
+        remover.removed.connect(self.project_dir_removed)
+        remover.finished.connect(lambda: self.dir_removers.remove(remover))
+        self.dir_removers.append(remover)
+        QTimer.singleShot(delay, remover.start)
+
+    def project_dir_removed(self, project_dir, error):
+        if not error:
+            return
+        message_log().logMessage(f"Mergin Maps plugin: {error}")
+        self.iface.messageBar().pushMessage(
+            "Mergin", f"Failed to remove all files of the local project {project_dir}", Qgis.Warning
+        )
+
     def check_project_server(self, project_dir, inform_user=True):
         """Check if the project was created for current plugin Mergin Maps server."""
         proj_server = None
@@ -263,6 +345,7 @@ class MerginProjectsManager(object):
 
         try:
             self.mc.reset_local_changes(project_dir, files_to_reset)
+            clear_qgis_files_cache(project_dir)
             if files_to_reset:
                 msg = f"File {files_to_reset} was successfully reset"
             else:
@@ -275,7 +358,7 @@ class MerginProjectsManager(object):
 
         self.open_project(os.path.dirname(current_project_filename))
 
-    def sync_project(self, project_dir, project_name=None):
+    def sync_project(self, project_dir, project_name=None, project_info=None):
         if not project_dir:
             return
         if not self.unsaved_changes_check(project_dir):
@@ -307,7 +390,9 @@ class MerginProjectsManager(object):
             QMessageBox.critical(None, "Project syncing", msg, QMessageBox.Close)
             return
 
-        if not sum(len(v) for v in list(pull_changes.values()) + list(push_changes.values())):
+        # only need to know whether there is any change, not how many
+        has_push_changes = any(push_changes.values())
+        if not (has_push_changes or any(pull_changes.values())):
             QMessageBox.information(None, "Project sync", "Project is already up-to-date", QMessageBox.Close)
             return
 
@@ -315,6 +400,8 @@ class MerginProjectsManager(object):
         dlg.pull_start(self.mc, project_dir, project_name)
 
         dlg.exec()  # blocks until success, failure or cancellation
+        # pull could add or remove QGIS project files in subdirectories
+        clear_qgis_files_cache(project_dir)
 
         if dlg.exception:
             # pull failed for some reason
@@ -347,7 +434,7 @@ class MerginProjectsManager(object):
             return
 
         # pull finished, start push
-        if any(push_changes.values()) and not self.mc.has_writing_permissions(project_name):
+        if has_push_changes and not self.has_writing_permissions(project_name, project_info):
             QMessageBox.information(
                 None, "Project sync", "You have no writing rights to this project", QMessageBox.Close
             )
@@ -356,6 +443,8 @@ class MerginProjectsManager(object):
         dlg = SyncDialog()
         dlg.push_start(self.mc, project_dir, project_name)
         dlg.exec()  # blocks until success, failure or cancellation
+        # project version has changed
+        self.invalidate_project_info(project_name)
 
         qgis_proj_filename = os.path.normpath(QgsProject.instance().fileName())
         qgis_proj_basename = os.path.basename(qgis_proj_filename)
@@ -364,7 +453,7 @@ class MerginProjectsManager(object):
             if updated["path"] == qgis_proj_basename:
                 qgis_proj_changed = True
                 break
-        if qgis_proj_filename in find_qgis_files(project_dir) and qgis_proj_changed:
+        if qgis_proj_filename in find_qgis_files_cached(project_dir) and qgis_proj_changed:
             self.open_project(project_dir)
 
         if dlg.exception:
@@ -390,7 +479,7 @@ class MerginProjectsManager(object):
 
         if dlg.is_complete:
             # TODO: report success only when we have actually done anything
-            msg = "Mergin Maps project {} synchronised successfully".format(project_name)
+            msg = f"Mergin Maps project {project_name} synchronised successfully"
             QMessageBox.information(None, "Project sync", msg, QMessageBox.Close)
             # clear canvas cache so any changes become immediately visible to users
             self.iface.mapCanvas().clearCache()
@@ -406,9 +495,9 @@ class MerginProjectsManager(object):
             "Use this option when you encounter synchronization issues, as the log is "
             "very useful to determine the exact cause of the problem.\n\n"
             "The log does not contain any of your data, only file names. It can be found here:\n"
-            "{}\n\nIt would be useful if you also send a mail to support@merginmaps.com "
+            f"{logs_path}\n\nIt would be useful if you also send a mail to support@merginmaps.com "
             "and briefly describe the problem to add more context to the diagnostic log.\n\n"
-            "Please click OK if you want to proceed.".format(logs_path)
+            "Please click OK if you want to proceed."
         )
 
         btn_reply = QMessageBox.question(None, "Submit diagnostic logs", msg, QMessageBox.Ok | QMessageBox.Cancel)
@@ -420,14 +509,12 @@ class MerginProjectsManager(object):
         QApplication.restoreOverrideCursor()
 
         if error:
-            QMessageBox.warning(
-                None, "Submit diagnostic logs", "Sending of diagnostic logs failed!\n\n{}".format(error)
-            )
+            QMessageBox.warning(None, "Submit diagnostic logs", f"Sending of diagnostic logs failed!\n\n{error}")
             return
         QMessageBox.information(
             None,
             "Submit diagnostic logs",
-            "Diagnostic logs successfully submitted - thank you!\n\n{}".format(log_file_name),
+            f"Diagnostic logs successfully submitted - thank you!\n\n{log_file_name}",
             QMessageBox.Close,
         )
 
@@ -482,6 +569,7 @@ class MerginProjectsManager(object):
         """
         try:
             conflicts = self.mc.resolve_unfinished_pull(project_dir)
+            clear_qgis_files_cache(project_dir)
             self.report_conflicts(conflicts)
         except ClientError as e:
             QMessageBox.critical(None, "Project sync", "Client error: " + str(e))
@@ -504,8 +592,8 @@ class MerginProjectsManager(object):
         QTimer.singleShot(delay, lambda: self.resolve_unfinished_pull(project_dir, True))
 
     def download_project(self, project):
-        project_name = posixpath.join(project["namespace"], project["name"])  # we need posix path for server API calls
-        settings = QSettings()
+        project_name = f"{project['namespace']}/{project['name']}"  # we need posix path for server API calls
+        settings = mergin_settings()
         last_parent_dir = settings.value("Mergin/lastUsedDownloadDir", str(Path.home()))
         parent_dir = QFileDialog.getExistingDirectory(
             None, "Open Directory", last_parent_dir, QFileDialog.Option.ShowDirsOnly
@@ -527,10 +615,10 @@ class MerginProjectsManager(object):
         dlg.exec()  # blocks until completion / failure / cancellation
         if dlg.exception:
             if isinstance(dlg.exception, (URLError, ValueError)):
-                QgsApplication.messageLog().logMessage("Mergin Maps plugin: " + str(dlg.exception))
+                message_log().logMessage("Mergin Maps plugin: " + str(dlg.exception))
                 msg = (
-                    "Failed to download your project {}.\n"
-                    "Please make sure your Mergin Maps settings are correct".format(project_name)
+                    f"Failed to download your project {project_name}.\n"
+                    "Please make sure your Mergin Maps settings are correct"
                 )
                 QMessageBox.critical(None, "Project download", msg, QMessageBox.Close)
             elif isinstance(dlg.exception, LoginError):
@@ -547,21 +635,17 @@ class MerginProjectsManager(object):
         if not dlg.is_complete:
             return  # either it has been cancelled or an error has been thrown
 
-        settings.setValue("Mergin/localProjects/{}/path".format(project_name), target_dir)
-        msg = "Your project {} has been successfully downloaded. Do you want to open project file?".format(project_name)
+        set_local_project_path(project_name, target_dir)
+        msg = f"Your project {project_name} has been successfully downloaded. Do you want to open project file?"
         btn_reply = QMessageBox.question(
             None, "Project download", msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
         )
         if btn_reply == QMessageBox.Yes:
             self.open_project(target_dir)
 
-        # reload the two browser groups (in case server is old)
-        groups = self.get_mergin_browser_groups()
-        for group in groups:
-            groups[group].reload()
-
-        # reload the Mergin Maps browser entry (in case server is ee/ce)
+        # re-create project items of the Mergin Maps browser entry (or its groups, in case server is old), so that
+        # the downloaded project is shown as local - the projects list does not need to be fetched again
         browser_model = self.iface.browserModel()
         root_idx = browser_model.findPath("Mergin Maps")
         item = browser_model.dataItem(root_idx)
-        item.reload()
+        item.refresh_projects()
@@ -23,6 +23,19 @@ from .utils import (
 )
 
 ui_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "ui", "ui_sync_dialog.ui")
+# form class generated from the UI file, see sync_dialog_ui()
+_sync_dialog_ui = None
+
+
+def sync_dialog_ui():
+    """
+    Get form class for the sync dialog. The dialog is created for every sync, so the UI file is compiled
+    just once, on the first use rather than on import to not slow down the plugin loading.
+    """
+    global _sync_dialog_ui
+    if _sync_dialog_ui is None:
+        _sync_dialog_ui, _ = uic.loadUiType(ui_file)
+    return _sync_dialog_ui
 
 
 class SyncDialog(QDialog):
@@ -33,7 +46,8 @@ class SyncDialog(QDialog):
 
     def __init__(self, parent=None):
         QDialog.__init__(self, parent)
-        self.ui = uic.loadUi(ui_file, self)
+        self.ui = sync_dialog_ui()()
+        self.ui.setupUi(self)
 
         self.ui.labelMergin.setPixmap(QPixmap(mm_logo_path()))
 
@@ -54,7 +68,7 @@ class SyncDialog(QDialog):
         self.timer.setInterval(100)
         self.timer.timeout.connect(self.timer_timeout)
 
-        self.btnCancel.clicked.connect(self.cancel_operation)
+        self.ui.btnCancel.clicked.connect(self.cancel_operation)
 
     def timer_timeout(self):
         if self.operation == self.DOWNLOAD:
@@ -100,7 +114,7 @@ class SyncDialog(QDialog):
         self.target_dir = target_dir
         self.project_name = project_name
 
-        self.labelStatus.setText("Querying project...")
+        self.ui.labelStatus.setText("Querying project...")
 
         # we would like to get the dialog displayed at least for a bit
         # with low timeout (or zero) it may not even appear before it is closed
@@ -121,15 +135,15 @@ class SyncDialog(QDialog):
         assert self.job  # if there was no error thrown, we should have a job
 
         # use kilobytes as a unit so we do not need to worry about int overflow with projects of few GB size
-        self.progress.setMaximum(int(self.job.total_size / 1024))
-        self.progress.setValue(0)
+        self.ui.progress.setMaximum(int(self.job.total_size / 1024))
+        self.ui.progress.setValue(0)
 
         self.timer.start()
 
-        self.labelStatus.setText("Downloading project...")
+        self.ui.labelStatus.setText("Downloading project...")
 
     def download_timer_tick(self):
-        self.progress.setValue(int(self.job.transferred_size / 1024))
+        self.ui.progress.setValue(int(self.job.transferred_size / 1024))
 
         try:
             is_running = download_project_is_running(self.job)
@@ -167,7 +181,7 @@ class SyncDialog(QDialog):
         self.target_dir = target_dir
         self.project_name = project_name
 
-        self.labelStatus.setText("Querying project...")
+        self.ui.labelStatus.setText("Querying project...")
 
         # we would like to get the dialog displayed at least for a bit
         # with low timeout (or zero) it may not even appear before it is closed
@@ -191,15 +205,15 @@ class SyncDialog(QDialog):
             return
 
         # use kilobytes as a unit so we do not need to worry about int overflow with projects of few GB size
-        self.progress.setMaximum(int(self.job.total_size / 1024))
-        self.progress.setValue(0)
+        self.ui.progress.setMaximum(int(self.job.total_size / 1024))
+        self.ui.progress.setValue(0)
 
         self.timer.start()
 
-        self.labelStatus.setText("Uploading project data...")
+        self.ui.labelStatus.setText("Uploading project data...")
 
     def push_timer_tick(self):
-        self.progress.setValue(int(self.job.transferred_size / 1024))
+        self.ui.progress.setValue(int(self.job.transferred_size / 1024))
 
         try:
             is_running = push_project_is_running(self.job)
@@ -237,7 +251,7 @@ class SyncDialog(QDialog):
         self.target_dir = target_dir
         self.project_name = project_name
 
-        self.labelStatus.setText("Querying project...")
+        self.ui.labelStatus.setText("Querying project...")
 
         # we would like to get the dialog displayed at least for a bit
         # with low timeout (or zero) it may not even appear before it is closed
@@ -261,15 +275,15 @@ class SyncDialog(QDialog):
             return
 
         # use kilobytes as a unit so we do not need to worry about int overflow with projects of few GB size
-        self.progress.setMaximum(int(self.job.total_size / 1024))
-        self.progress.setValue(0)
+        self.ui.progress.setMaximum(int(self.job.total_size / 1024))
+        self.ui.progress.setValue(0)
 
         self.timer.start()
 
-        self.labelStatus.setText("Downloading project data...")
+        self.ui.labelStatus.setText("Downloading project data...")
 
     def pull_timer_tick(self):
-        self.progress.setValue(int(self.job.transferred_size / 1024))
+        self.ui.progress.setValue(int(self.job.transferred_size / 1024))
 
         try:
             is_running = pull_project_is_running(self.job)
@@ -303,7 +317,7 @@ class SyncDialog(QDialog):
 
     def cancel_sync_operation(self, msg, cancel_func):
         self.timer.stop()
-        self.labelStatus.setText(msg)
+        self.ui.labelStatus.setText(msg)
         QApplication.setOverrideCursor(Qt.WaitCursor)
         cancel_func(self.job)
         QApplication.restoreOverrideCursor()
@@ -3,6 +3,7 @@
 import os
 import json
 import copy
+import sqlite3
 import tempfile
 
 from qgis.PyQt.QtCore import QVariant
@@ -16,7 +17,17 @@ from qgis.core import (
 )
 
 from qgis.testing import start_app, unittest
-from Mergin.utils import same_schema, get_datum_shift_grids, is_valid_name, create_tracking_layer
+from Mergin.utils import (
+    same_schema,
+    get_datum_shift_grids,
+    is_valid_name,
+    create_tracking_layer,
+    find_qgis_files_cached,
+    clear_qgis_files_cache,
+    get_schema,
+    is_inside_dir,
+    pretty_summary,
+)
 
 test_data_path = os.path.join(os.path.dirname(__file__), "data")
 
@@ -197,6 +208,76 @@ class test_utils(unittest.TestCase):
             self.assertEqual(fields[4].name(), "tracked_by")
             self.assertEqual(fields[4].type(), QVariant.String)
 
+    def test_find_qgis_files_cached(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertEqual(find_qgis_files_cached(temp_dir), [])
+
+            project_file = os.path.join(temp_dir, "project.qgz")
+            open(project_file, "w").close()
+            # force different modification time, in case file system has low mtime resolution
+            os.utime(temp_dir, ns=(0, 0))
+            self.assertEqual(find_qgis_files_cached(temp_dir), [project_file])
+
+            # files added to or removed from a subdirectory are picked up too
+            sub_dir = os.path.join(temp_dir, "sub")
+            os.mkdir(sub_dir)
+            os.utime(sub_dir, ns=(0, 0))
+            self.assertEqual(find_qgis_files_cached(temp_dir), [project_file])
+            sub_project_file = os.path.join(sub_dir, "other.qgs")
+            open(sub_project_file, "w").close()
+            self.assertEqual(sorted(find_qgis_files_cached(temp_dir)), sorted([project_file, sub_project_file]))
+            os.utime(sub_dir, ns=(0, 0))
+            self.assertEqual(sorted(find_qgis_files_cached(temp_dir)), sorted([project_file, sub_project_file]))
+            os.remove(sub_project_file)
+            self.assertEqual(find_qgis_files_cached(temp_dir), [project_file])
+
+            clear_qgis_files_cache(temp_dir)
+            self.assertEqual(find_qgis_files_cached(temp_dir), [project_file])
+
+    def test_get_schema_cached(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = create_tracking_layer(temp_dir)
+
+            schema = get_schema(file_path)
+            self.assertIs(get_schema(file_path), schema)
+            table = next(t for t in schema if t["table"] == "tracking_layer")
+            self.assertNotIn("note", [c["name"] for c in table["columns"]])
+
+            # schema change is picked up as the file is modified
+            conn = sqlite3.connect(file_path)
+            conn.execute('ALTER TABLE "tracking_layer" ADD COLUMN "note" TEXT')
+            conn.commit()
+            conn.close()
+            schema = get_schema(file_path)
+            table = next(t for t in schema if t["table"] == "tracking_layer")
+            self.assertIn("note", [c["name"] for c in table["columns"]])
+
+    def test_is_inside_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_dir = os.path.join(temp_dir, "project")
+            self.assertTrue(is_inside_dir(project_dir, project_dir))
+            self.assertTrue(is_inside_dir(os.path.join(project_dir, "data.gpkg"), project_dir))
+            self.assertTrue(is_inside_dir(os.path.join(project_dir, "sub", "data.gpkg"), project_dir + os.sep))
+            # directory name being a prefix of another directory name does not count
+            self.assertFalse(is_inside_dir(os.path.join(temp_dir, "project2", "data.gpkg"), project_dir))
+            self.assertFalse(is_inside_dir(temp_dir, project_dir))
+            self.assertFalse(is_inside_dir("", project_dir))
+
+    def test_pretty_summary(self):
+        summary = {
+            "data.gpkg": {
+                "geodiff_summary": [
+                    {"table": "gpkg_contents", "insert": 0, "update": 1, "delete": 0},
+                    {"table": "points", "insert": 2, "update": 1, "delete": 0},
+                ]
+            }
+        }
+        self.assertEqual(
+            pretty_summary(summary),
+            "\nDetails data.gpkg\n layer name - points: inserted: 2, modified: 1, deleted: 0",
+        )
+        self.assertEqual(pretty_summary({}), "")
+
 
 if __name__ == "__main__":
     nose2.main()
@@ -1,4 +1,5 @@
 import shutil
+from collections import OrderedDict
 from datetime import datetime, timezone
 from enum import Enum
 from urllib.error import URLError, HTTPError
@@ -13,10 +14,11 @@ import tempfile
 import json
 import glob
 import re
+import threading
 
 from qgis.PyQt.QtCore import QSettings, QVariant
 from qgis.PyQt.QtWidgets import QMessageBox, QFileDialog
-from qgis.PyQt.QtGui import QPalette, QColor
+from qgis.PyQt.QtGui import QIcon, QPalette, QColor, QGuiApplication
 from qgis.core import (
     NULL,
     Qgis,
@@ -61,7 +63,6 @@ from qgis.core import (
 )
 
 from .mergin.utils import int_version, bytes_to_human_size
-from .mergin.merginproject import MerginProject
 
 try:
     from .mergin.common import ClientError, ErrorCode, LoginError, InvalidProject
@@ -114,7 +115,13 @@ except ImportError:
     from .mergin.report import create_report
     from .mergin.deps import pygeodiff
 
+PLUGIN_DIR = os.path.dirname(os.path.realpath(__file__))
+IMAGES_DIR = os.path.join(PLUGIN_DIR, "images")
+
 MERGIN_URL = "https://app.merginmaps.com"
+# settings keys used across the plugin modules
+SERVER_SETTINGS_KEY = "Mergin/server"
+LAST_WORKSPACE_SETTINGS_KEY = "Mergin/lastUsedWorkspaceId"
 MERGIN_LOGS_URL = "https://g4pfq226j0.execute-api.eu-west-1.amazonaws.com/mergin_client_log_submit"
 
 QGIS_NET_PROVIDERS = ("WFS", "arcgisfeatureserver", "arcgismapserver", "geonode", "ows", "wcs", "wms", "vectortile")
@@ -133,6 +140,7 @@ QGIS_FILE_BASED_PROVIDERS = (
     "vectortile",
 )
 PACKABLE_PROVIDERS = ("ogr", "gdal", "delimitedtext", "gpx", "postgres", "memory")
+DIFFABLE_EXTENSIONS = (".gpkg", ".sqlite")
 
 PROJS_PER_PAGE = 50
 
@@ -208,10 +216,85 @@ def find_qgis_files(directory):
     return qgis_files
 
 
+# cached QGIS project files, key: directory, value: tuple (modification times of scanned directories, files)
+_qgis_files = dict()
+
+
+def _scan_qgis_files(directory):
+    """
+    Same as find_qgis_files(), but also returns modification times of all the scanned directories. Directories are
+    stat-ed before they are listed, so that files added during the scan are not missed by later checks.
+    """
+    dir_mtimes = {directory: os.stat(directory).st_mtime_ns}
+    qgis_files = []
+    for root, dirs, files in os.walk(directory):
+        for d in dirs:
+            dir_path = os.path.join(root, d)
+            try:
+                dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                pass
+        for f in files:
+            _, ext = os.path.splitext(f)
+            if ext in [".qgs", ".qgz"]:
+                qgis_files.append(os.path.join(root, f))
+    return dir_mtimes, qgis_files
+
+
+def _dirs_unchanged(dir_mtimes):
+    """Check whether none of the directories was modified (or removed) since the modification times were taken."""
+    try:
+        return all(os.stat(d).st_mtime_ns == mtime for d, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+def find_qgis_files_cached(directory):
+    """
+    Same as find_qgis_files(), but the result of the directory scan is reused as long as none of the scanned
+    directories is modified. Adding or removing a file anywhere in the tree changes the modification time
+    of its parent directory, so checking them is much cheaper than listing all the files again.
+    """
+    key = os.path.normpath(directory)
+    cached = _qgis_files.get(key)
+    if cached is not None and _dirs_unchanged(cached[0]):
+        return cached[1]
+    try:
+        dir_mtimes, qgis_files = _scan_qgis_files(key)
+    except OSError:
+        _qgis_files.pop(key, None)
+        return []
+    _qgis_files[key] = (dir_mtimes, qgis_files)
+    return qgis_files
+
+
+def clear_qgis_files_cache(directory=None):
+    """Invalidate cached QGIS project files for the given directory, or for all directories if it is None."""
+    if directory is None:
+        _qgis_files.clear()
+    else:
+        _qgis_files.pop(os.path.normpath(directory), None)
+
+
+_thread_settings = threading.local()
+
+
+def mergin_settings():
+    """
+    Get QSettings instance shared by the plugin. QSettings is reentrant, but not thread-safe, so one instance
+    is created per thread. Callers using groups must end them, so that the next caller gets the root group.
+    """
+    settings = getattr(_thread_settings, "settings", None)
+    if settings is None:
+        settings = QSettings()
+        _thread_settings.settings = settings
+    return settings
+
+
 def get_mergin_auth():
-    settings = QSettings()
+    settings = mergin_settings()
     save_credentials = settings.value("Mergin/saveCredentials", "false").lower() == "true"
-    mergin_url = settings.value("Mergin/server", MERGIN_URL)
+    mergin_url = settings.value(SERVER_SETTINGS_KEY, MERGIN_URL)
     auth_manager = QgsApplication.authManager()
     if not save_credentials or not auth_manager.masterPasswordHashInDatabase():
         return mergin_url, "", ""
@@ -226,7 +309,7 @@ def get_mergin_auth():
 
 
 def set_mergin_auth(url, username, password):
-    settings = QSettings()
+    settings = mergin_settings()
     authcfg = settings.value("Mergin/authcfg", None)
     cfg = QgsAuthMethodConfig()
     auth_manager = QgsApplication.authManager()
@@ -247,13 +330,13 @@ def set_mergin_auth(url, username, password):
         auth_manager.storeAuthenticationConfig(cfg)
         settings.setValue("Mergin/authcfg", cfg.id())
 
-    settings.setValue("Mergin/server", url)
+    settings.setValue(SERVER_SETTINGS_KEY, url)
 
 
 def get_qgis_proxy_config(url=None):
     """Check if a proxy is enabled and needed for the given url. Return the settings and additional info."""
     proxy_config = None
-    s = QSettings()
+    s = mergin_settings()
     proxy_enabled = s.value("proxy/proxyEnabled", False, type=bool)
     if proxy_enabled:
         proxy_type = s.value("proxy/proxyType")
@@ -294,11 +377,24 @@ def get_qgis_proxy_config(url=None):
     return proxy_config
 
 
-def create_mergin_client():
+def mergin_client_params():
+    """
+    Get parameters for creating Mergin Maps client: tuple (url, username, password, proxy config).
+    These are read using QGIS authentication framework, which may ask for the master password,
+    so this needs to be called from the main thread.
+    """
     url, username, password = get_mergin_auth()
-    settings = QSettings()
+    return url, username, password, get_qgis_proxy_config(url)
+
+
+def create_mergin_client(client_params=None):
+    """
+    Create Mergin Maps client, logging in to the server if needed. If client_params from mergin_client_params()
+    are given, the client can be created in a worker thread.
+    """
+    url, username, password, proxy_config = client_params if client_params is not None else mergin_client_params()
+    settings = mergin_settings()
     auth_token = settings.value("Mergin/auth_token", None)
-    proxy_config = get_qgis_proxy_config(url)
     if auth_token:
         mc = MerginClient(url, auth_token, username, password, get_plugin_version(), proxy_config)
         # check token expiration
@@ -312,12 +408,48 @@ def create_mergin_client():
     try:
         mc = MerginClient(url, None, username, password, get_plugin_version(), proxy_config)
     except (URLError, ClientError) as e:
-        QgsApplication.messageLog().logMessage(str(e))
+        message_log().logMessage(str(e))
         raise
     settings.setValue("Mergin/auth_token", mc._auth_session["token"])
     return MerginClient(url, mc._auth_session["token"], username, password, get_plugin_version(), proxy_config)
 
 
+# clients are cached per thread, processing algorithms may run in parallel and the client is not thread-safe
+_thread_clients = threading.local()
+# incremented by clear_shared_mergin_clients(), clients cached with an older generation are not used anymore
+_shared_clients_generation = 0
+
+
+def shared_mergin_client():
+    """
+    Get Mergin Maps client for the configured connection. Within a thread, the client is reused by subsequent
+    calls while the connection settings, stored auth token and generation are the same and the token is valid,
+    so that e.g. processing algorithms run in a batch or model do not create a new client for every run.
+    """
+    client_params = mergin_client_params()
+    cached = getattr(_thread_clients, "client", None)
+    if cached is not None:
+        generation, params, auth_token, mc = cached
+        if (
+            generation == _shared_clients_generation
+            and params == client_params
+            and auth_token == mergin_settings().value("Mergin/auth_token", None)
+        ):
+            delta = mc._auth_session["expire"] - datetime.now(timezone.utc)
+            if delta.total_seconds() > 60:
+                return mc
+    mc = create_mergin_client(client_params)
+    auth_token = mergin_settings().value("Mergin/auth_token", None)
+    _thread_clients.client = (_shared_clients_generation, client_params, auth_token, mc)
+    return mc
+
+
+def clear_shared_mergin_clients():
+    """Stop reusing clients returned by shared_mergin_client() in all threads, e.g. when connection settings change."""
+    global _shared_clients_generation
+    _shared_clients_generation += 1
+
+
 def get_qgis_version_str():
     """Returns QGIS verion as 'MAJOR.MINOR.PATCH', for example '3.10.6'"""
     # there's also Qgis.QGIS_VERSION which is string but also includes release name (possibly with unicode characters)
@@ -329,7 +461,7 @@ def get_qgis_version_str():
 
 
 def plugin_version():
-    with open(os.path.join(os.path.dirname(__file__), "metadata.txt"), "r") as f:
+    with open(os.path.join(PLUGIN_DIR, "metadata.txt"), "r") as f:
         config = configparser.ConfigParser()
         config.read_file(f)
     return config["general"]["version"]
@@ -348,9 +480,8 @@ def is_versioned_file(file):
     :returns: if file is compatible with geodiff lib
     :rtype: bool
     """
-    diff_extensions = [".gpkg", ".sqlite"]
     f_extension = os.path.splitext(file)[1]
-    return f_extension in diff_extensions
+    return f_extension in DIFFABLE_EXTENSIONS
 
 
 def send_logs(username, logfile):
@@ -424,13 +555,26 @@ def same_dir(dir1, dir2):
     return path1 == path2
 
 
+def is_inside_dir(path, directory):
+    """Check if the path is the directory itself or is located (at any depth) inside of it."""
+    if not path or not directory:
+        return False
+    path = os.path.normcase(os.path.realpath(path))
+    directory = os.path.normcase(os.path.realpath(directory))
+    try:
+        return os.path.commonpath([path, directory]) == directory
+    except ValueError:
+        # paths on different drives
+        return False
+
+
 def get_new_qgis_project_filepath(project_name=None):
     """
     Get path for a new QGIS project. If name is not None, only ask for a directory.
     :name: filename of new project
     :return: string with file path, or None on cancellation
     """
-    settings = QSettings()
+    settings = mergin_settings()
     last_dir = settings.value("Mergin/lastUsedDownloadDir", str(pathlib.Path.home()))
     if project_name is not None:
         dest_dir = QFileDialog.getExistingDirectory(
@@ -455,31 +599,27 @@ def unsaved_project_check():
     :return: UnsavedChangesStrategy enumerator defining if previous method should continue
     :type: Enum
     """
-    if (
-        any(
-            [
-                type(layer) is QgsVectorLayer and layer.isModified()
-                for layer in QgsProject.instance().mapLayers().values()
-            ]
-        )
-        or QgsProject.instance().isDirty()
-    ):
+    project = QgsProject.instance()
+    # collect modified layers in a single pass, so they do not need to be looked up again when committing
+    modified_layers = [
+        layer for layer in project.mapLayers().values() if isinstance(layer, QgsVectorLayer) and layer.isModified()
+    ]
+    if modified_layers or project.isDirty():
         msg = "There are some unsaved changes. Do you want save them before continue?"
         btn_reply = QMessageBox.warning(
             None, "Unsaved changes", msg, QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
         )
         if btn_reply == QMessageBox.Yes:
-            for layer in QgsProject.instance().mapLayers().values():
-                if type(layer) is QgsVectorLayer and layer.isModified():
-                    layer.commitChanges()
-            if QgsProject.instance().isDirty():
-                if QgsProject.instance().fileName():
-                    QgsProject.instance().write()
+            for layer in modified_layers:
+                layer.commitChanges()
+            if project.isDirty():
+                if project.fileName():
+                    project.write()
                 else:
                     project_file = get_new_qgis_project_filepath()
                     if project_file:
-                        QgsProject.instance().setFileName(project_file)
-                        write_ok = QgsProject.instance().write()
+                        project.setFileName(project_file)
+                        write_ok = project.write()
                         if not write_ok:
                             QMessageBox.warning(
                                 None, "Error Saving Project", "QGIS project was not saved properly. Cancelling..."
@@ -897,7 +1037,7 @@ def write_raster(raster_layer, raster_writer, write_path):
 
 
 def login_error_message(e):
-    QgsApplication.messageLog().logMessage(f"Mergin Maps plugin: {str(e)}")
+    message_log().logMessage(f"Mergin Maps plugin: {str(e)}")
     msg = "<font color=red>Security token has been expired, failed to renew. Check your username and password </font>"
     QMessageBox.critical(None, "Login failed", msg, QMessageBox.Close)
 
@@ -929,49 +1069,169 @@ def unhandled_exception_message(error_details, dialog_title, error_text, log_fil
     box.exec()
 
 
+MERGIN_GLOBAL_VARIABLES = ("mergin_username", "mergin_url")
+
+
+def set_global_variables(variables, remove=()):
+    """
+    Set QGIS global variables from the dict of variable names and values, and remove the variables with names
+    given in remove. All the variables are updated at once, every setGlobalVariable() call would write all
+    the global variables to the settings and notify listeners.
+    """
+    all_variables = QgsApplication.customVariables()
+    all_variables.update(variables)
+    for name in remove:
+        all_variables.pop(name, None)
+    QgsExpressionContextUtils.setGlobalVariables(all_variables)
+
+
+def remove_global_variables(names):
+    """Remove QGIS global variables with the given names at once, if any of them is set."""
+    all_variables = QgsApplication.customVariables()
+    if not any(name in all_variables for name in names):
+        return
+    for name in names:
+        all_variables.pop(name, None)
+    QgsExpressionContextUtils.setGlobalVariables(all_variables)
+
+
+MERGIN_PROJECT_VARIABLES = (
+    "mergin_project_name",
+    "mergin_project_owner",
+    "mergin_project_full_name",
+    "mergin_project_version",
+    "mergin_project_server",
+)
+
+
 def write_project_variables(project_owner, project_name, project_full_name, version, server):
-    QgsExpressionContextUtils.setProjectVariable(QgsProject.instance(), "mergin_project_name", project_name)
-    QgsExpressionContextUtils.setProjectVariable(QgsProject.instance(), "mergin_project_owner", project_owner)
-    QgsExpressionContextUtils.setProjectVariable(QgsProject.instance(), "mergin_project_full_name", project_full_name)
-    QgsExpressionContextUtils.setProjectVariable(QgsProject.instance(), "mergin_project_version", int_version(version))
-    QgsExpressionContextUtils.setProjectVariable(QgsProject.instance(), "mergin_project_server", server)
+    # update all the variables at once, every setProjectVariable() call would rewrite the whole variables map
+    project = QgsProject.instance()
+    variables = project.customVariables()
+    variables["mergin_project_name"] = project_name
+    variables["mergin_project_owner"] = project_owner
+    variables["mergin_project_full_name"] = project_full_name
+    variables["mergin_project_version"] = int_version(version)
+    variables["mergin_project_server"] = server
+    QgsExpressionContextUtils.setProjectVariables(project, variables)
 
 
 def remove_project_variables():
-    QgsExpressionContextUtils.removeProjectVariable(QgsProject.instance(), "mergin_project_name")
-    QgsExpressionContextUtils.removeProjectVariable(QgsProject.instance(), "mergin_project_full_name")
-    QgsExpressionContextUtils.removeProjectVariable(QgsProject.instance(), "mergin_project_version")
-    QgsExpressionContextUtils.removeProjectVariable(QgsProject.instance(), "mergin_project_owner")
-    QgsExpressionContextUtils.removeProjectVariable(QgsProject.instance(), "mergin_project_server")
+    project = QgsProject.instance()
+    variables = project.customVariables()
+    if not any(name in variables for name in MERGIN_PROJECT_VARIABLES):
+        return
+    for name in MERGIN_PROJECT_VARIABLES:
+        variables.pop(name, None)
+    QgsExpressionContextUtils.setProjectVariables(project, variables)
 
 
 def pretty_summary(summary):
-    msg = ""
+    parts = []
     for k, v in summary.items():
-        msg += "\nDetails " + k
-        msg += "".join(
-            "\n layer name - "
-            + d["table"]
-            + ": inserted: "
-            + str(d["insert"])
-            + ", modified: "
-            + str(d["update"])
-            + ", deleted: "
-            + str(d["delete"])
+        parts.append(f"\nDetails {k}")
+        parts.extend(
+            f"\n layer name - {d['table']}: inserted: {d['insert']}, modified: {d['update']}, deleted: {d['delete']}"
             for d in v["geodiff_summary"]
             if d["table"] != "gpkg_contents"
         )
-    return msg
+    return "".join(parts)
+
+
+LOCAL_PROJECTS_GROUP = "Mergin/localProjects"
+
+_local_project_paths = None
+_local_project_names = None
+# names of local projects whose directories were already checked to be Mergin Maps projects
+_validated_local_projects = set()
+
+
+def local_project_paths():
+    """
+    Get a dict of local Mergin Maps projects paths, keyed by project full name ('<namespace>/<project_name>').
+    The Mergin/localProjects QSettings group is read only once, subsequent calls use the cached values.
+    """
+    global _local_project_paths
+    if _local_project_paths is None:
+        _local_project_paths = dict()
+        settings = mergin_settings()
+        settings.beginGroup(LOCAL_PROJECTS_GROUP)
+        for key in settings.allKeys():
+            # Expecting key in the following form: '<namespace>/<project_name>/path'
+            key_parts = key.split("/")
+            if len(key_parts) > 2 and key_parts[2] == "path":
+                _local_project_paths[f"{key_parts[0]}/{key_parts[1]}"] = settings.value(key, None)
+        settings.endGroup()
+    return _local_project_paths
+
+
+def local_project_name(project_dir):
+    """
+    Get full name of the local Mergin Maps project stored in the given directory, or None if the directory is not
+    listed in local projects. Uses a reverse index of the local projects paths cache, built on the first call.
+    """
+    global _local_project_names
+    if _local_project_names is None:
+        _local_project_names = {
+            os.path.normcase(os.path.normpath(path)): name for name, path in local_project_paths().items() if path
+        }
+    return _local_project_names.get(os.path.normcase(os.path.normpath(project_dir)))
+
+
+def set_local_project_path(project_name, path, server=None):
+    """
+    Store local path of the Mergin Maps project in QSettings and in the local projects paths cache.
+    If server is given, the server the project was created for is stored too.
+    """
+    settings = mergin_settings()
+    settings.beginGroup(f"{LOCAL_PROJECTS_GROUP}/{project_name}")
+    settings.setValue("path", path)
+    if server is not None:
+        settings.setValue("server", server)
+    settings.endGroup()
+    local_project_paths()[project_name] = path
+    _validated_local_projects.discard(project_name)
+    _clear_local_project_names()
+
+
+def remove_local_project_path(project_name, remove_all=False):
+    """
+    Remove local path of the Mergin Maps project from QSettings and from the local projects paths cache.
+    If remove_all is True, all the project settings (e.g. server) are removed.
+    """
+    key = f"{LOCAL_PROJECTS_GROUP}/{project_name}"
+    if not remove_all:
+        key += "/path"
+    mergin_settings().remove(key)
+    local_project_paths().pop(project_name, None)
+    _validated_local_projects.discard(project_name)
+    _clear_local_project_names()
+
+
+def _clear_local_project_names():
+    global _local_project_names
+    _local_project_names = None
+
+
+def clear_local_project_paths_cache():
+    """
+    Invalidate the local projects paths cache, it will be read again from QSettings on next access and the project
+    directories will be checked again.
+    """
+    global _local_project_paths
+    _local_project_paths = None
+    _validated_local_projects.clear()
+    _clear_local_project_names()
 
 
 def get_local_mergin_projects_info():
     """Get a list of local Mergin Maps projects info from QSettings."""
     local_projects_info = []
-    settings = QSettings()
-    config_server = settings.value("Mergin/server", None)
+    settings = mergin_settings()
+    config_server = settings.value(SERVER_SETTINGS_KEY, None)
     if config_server is None:
         return local_projects_info
-    settings.beginGroup("Mergin/localProjects/")
+    settings.beginGroup(LOCAL_PROJECTS_GROUP)
     for key in settings.allKeys():
         # Expecting key in the following form: '<namespace>/<project_name>/path'
         # - needs project dir to load metadata
@@ -979,7 +1239,7 @@ def get_local_mergin_projects_info():
         if len(key_parts) > 2 and key_parts[2] == "path":
             local_path = settings.value(key, None)
             # double check if the path exists - it might get deleted manually
-            if local_path is None or not os.path.exists(local_path):
+            if local_path is None or not os.path.isdir(local_path):
                 continue
             # We also need the server the project was created for, but users may already have some projects created
             # without the server specified. In that case, let's assume it is currently defined server and also store
@@ -991,57 +1251,103 @@ def get_local_mergin_projects_info():
                 settings.setValue(server_key, config_server)
             # project info = (path, project owner, project name, server)
             local_projects_info.append((local_path, key_parts[0], key_parts[1], proj_server))
+    settings.endGroup()
     return local_projects_info
 
 
-def set_qgis_project_mergin_variables():
-    """Check if current QGIS project is a local Mergin Maps project and set QGIS project variables for Mergin Maps."""
-    qgis_project_path = QgsProject.instance().absolutePath()
-    if not qgis_project_path:
-        return None
-    for local_path, owner, name, server in get_local_mergin_projects_info():
-        if same_dir(path, qgis_project_path):
-            try:
-                mp = MerginProject(path)
-                write_project_variables(owner, name, mp.project_full_name(), mp.version(), server)
-                return mp.project_full_name()
-            except InvalidProject:
-                remove_project_variables()
-    return None
-
-
 def mergin_project_local_path(project_name=None):
     """
     Try to get local Mergin Maps project path. If project_name is specified, look for this specific project, otherwise
     check if current QGIS project directory is listed in QSettings Mergin Maps local projects list.
     :return: Mergin Maps project local path if project was already downloaded, None otherwise.
     """
-    settings = QSettings()
     if project_name is not None:
-        proj_path = settings.value(f"Mergin/localProjects/{project_name}/path", None)
-        # check local project dir was not unintentionally removed, or .mergin dir was removed
-        if proj_path:
-            if not os.path.exists(proj_path) or not check_mergin_subdirs(proj_path):
+        proj_path = local_project_paths().get(project_name)
+        # check local project dir was not unintentionally removed, or .mergin dir was removed - just once until
+        # the local projects paths cache is cleared, as this is called for every project listed in the browser
+        if proj_path and project_name not in _validated_local_projects:
+            # a single stat of the .mergin subdir proves the project dir exists too, full check is done only if missing
+            if not os.path.isdir(os.path.join(proj_path, ".mergin")) and not check_mergin_subdirs(proj_path):
                 # project dir does not exist or is not a Mergin project anymore, let's remove it from settings
-                settings.remove(f"Mergin/localProjects/{project_name}/path")
+                remove_local_project_path(project_name)
                 proj_path = None
+            else:
+                _validated_local_projects.add(project_name)
         return proj_path
 
-    qgis_project_path = os.path.normpath(QgsProject.instance().absolutePath())
-    if not qgis_project_path:
+    qgis_project_path = QgsProject.instance().absolutePath()
+    if not qgis_project_path or mergin_settings().value(SERVER_SETTINGS_KEY, None) is None:
         return None
 
-    for local_path, owner, name, server in get_local_mergin_projects_info():
-        if same_dir(local_path, qgis_project_path):
-            return qgis_project_path
+    # single lookup in the index of local projects instead of checking all the local projects paths
+    if local_project_name(qgis_project_path) is None:
+        return None
+    return os.path.normpath(qgis_project_path)
+
+
+_message_log = None
+
+
+def message_log():
+    """Get QGIS message log. The instance is looked up just once and then reused."""
+    global _message_log
+    if _message_log is None:
+        _message_log = QgsApplication.messageLog()
+    return _message_log
 
-    return None
+
+_icons_dir = None
 
 
 def icon_path(icon_filename):
-    icon_set = "white" if is_dark_theme() else "default"
-    ipath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "images", icon_set, "tabler_icons", icon_filename)
-    return ipath
+    # theme is detected just once, icon paths are requested for every browser item
+    global _icons_dir
+    if _icons_dir is None:
+        icon_set = "white" if is_dark_theme() else "default"
+        _icons_dir = os.path.join(IMAGES_DIR, icon_set, "tabler_icons")
+    return os.path.join(_icons_dir, icon_filename)
+
+
+_icons = dict()
+
+# sizes used to display icons of items in the QGIS browser and tree views
+ITEM_ICON_SIZES = (16, 24)
+
+
+def cached_icon(path):
+    """
+    Get QIcon for the image with the given path. Icons are created only once and then shared
+    (QIcon is implicitly shared, so the same instance can be safely used by multiple items).
+    """
+    icon = _icons.get(path)
+    if icon is None:
+        icon = QIcon(path)
+        _icons[path] = icon
+    return icon
+
+
+def prerender_icons(paths, sizes=ITEM_ICON_SIZES):
+    """
+    Rasterize icons for the given image paths to pixmaps of the given sizes (also scaled by the device pixel ratio
+    for HiDPI screens) and add them to the cached SVG icons, so that SVGs are not parsed and rendered again every
+    time an item is painted at one of these sizes. Icons stay scalable, other sizes are still rendered from the SVG.
+    Pixmaps can only be created in the main thread, so this should be called when the plugin is loaded.
+    """
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    pixel_sizes = sorted({px for size in sizes for px in (size, round(size * ratio))})
+    for path in paths:
+        svg_icon = QIcon(path)
+        icon = QIcon(path)
+        for px in pixel_sizes:
+            icon.addPixmap(svg_icon.pixmap(px, px))
+        _icons[path] = icon
+
+
+def clear_icon_cache():
+    """Release cached icons, icon theme is detected again on the next use."""
+    global _icons_dir
+    _icons.clear()
+    _icons_dir = None
 
 
 def mm_logo_path():
@@ -1052,7 +1358,7 @@ def mm_logo_path():
         icon_set = "default"
         icon_filename = "MM_logo_HORIZ_COLOR_VECTOR.svg"
 
-    ipath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "images", icon_set, icon_filename)
+    ipath = os.path.join(IMAGES_DIR, icon_set, icon_filename)
     return ipath
 
 
@@ -1065,7 +1371,7 @@ def mm_symbol_path():
         icon_color = "COLOR"
 
     icon_filename = "MM_symbol_" + icon_color + "_no_padding.svg"
-    ipath = os.path.join(os.path.dirname(os.path.realpath(__file__)), "images", icon_set, icon_filename)
+    ipath = os.path.join(IMAGES_DIR, icon_set, icon_filename)
     return ipath
 
 
@@ -1088,10 +1394,41 @@ def is_number(s):
         return False
 
 
+SCHEMAS_CACHE_SIZE = 32  # schemas of the most recently used files kept in the cache
+_schemas = OrderedDict()  # key: normalized file path, value: tuple (file state, schema), least recently used first
+
+
+def _schema_file_state(path):
+    """Modification times and sizes of the database file and its write-ahead log, None if it does not exist."""
+    state = []
+    for p in (path, path + "-wal"):
+        try:
+            st = os.stat(p)
+        except OSError:
+            if p == path:
+                return None
+            continue
+        state.append((st.st_mtime_ns, st.st_size))
+    return tuple(state)
+
+
 def get_schema(layer_path):
     """
-    Return JSON representation of the layer schema
+    Return JSON representation of the layer schema. The schema is reused as long as the database file
+    (or its write-ahead log) does not change, as it is often requested for the same file repeatedly,
+    e.g. once for every layer of a GeoPackage during validation.
     """
+    key = os.path.normpath(layer_path)
+    state = _schema_file_state(key)
+    if state is None:
+        # file does not exist (anymore), do not keep its schema around
+        _schemas.pop(key, None)
+    else:
+        cached = _schemas.get(key)
+        if cached is not None and cached[0] == state:
+            _schemas.move_to_end(key)
+            return cached[1]
+
     geodiff = pygeodiff.GeoDiff()
 
     tmp_file = tempfile.NamedTemporaryFile(delete=False)
@@ -1101,6 +1438,11 @@ def get_schema(layer_path):
         data = f.read()
         schema = json.loads(data.replace("\n", "")).get("geodiff_schema")
     os.unlink(tmp_file.name)
+    if state is not None:
+        _schemas[key] = (state, schema)
+        _schemas.move_to_end(key)
+        if len(_schemas) > SCHEMAS_CACHE_SIZE:
+            _schemas.popitem(last=False)
     return schema
 
 
@@ -1216,7 +1558,7 @@ def test_server_connection(url, username, password):
     err_msg = validate_mergin_url(url)
     if err_msg:
         msg = f"<font color=red>{err_msg}</font>"
-        QgsApplication.messageLog().logMessage(f"Mergin Maps plugin: {err_msg}")
+        message_log().logMessage(f"Mergin Maps plugin: {err_msg}")
         return False, msg
 
     result = True, "<font color=green> OK </font>"
@@ -1224,7 +1566,7 @@ def test_server_connection(url, username, password):
     try:
         MerginClient(url, None, username, password, get_plugin_version(), proxy_config)
     except (LoginError, ClientError) as e:
-        QgsApplication.messageLog().logMessage(f"Mergin Maps plugin: {str(e)}")
+        message_log().logMessage(f"Mergin Maps plugin: {str(e)}")
         result = False, f"<font color=red> Connection failed, {str(e)} </font>"
 
     return result
@@ -2,6 +2,7 @@ import os
 import re
 from enum import Enum
 from collections import defaultdict
+from itertools import chain
 
 from qgis.core import (
     QgsMapLayerType,
@@ -13,7 +14,7 @@ from qgis.core import (
 
 from .help import MerginHelp
 from .utils import (
-    find_qgis_files,
+    find_qgis_files_cached,
     same_dir,
     has_schema_change,
     get_primary_keys,
@@ -127,7 +128,7 @@ class MerginProjectValidator(object):
 
     def check_single_proj(self, project_dir):
         """Check if there is one and only one QGIS project in the directory."""
-        self.qgis_files = find_qgis_files(project_dir)
+        self.qgis_files = find_qgis_files_cached(project_dir)
         if len(self.qgis_files) > 1:
             self.issues.append(MultipleLayersWarning(Warning.MULTIPLE_PROJS))
             return False
@@ -187,8 +188,9 @@ class MerginProjectValidator(object):
 
     def check_saved_in_proj_dir(self):
         """Check if layers saved in project's directory."""
+        file_based = set(chain(self.layers_by_prov["gdal"], self.layers_by_prov["ogr"]))
         for lid, layer in self.layers.items():
-            if lid not in self.layers_by_prov["gdal"] + self.layers_by_prov["ogr"]:
+            if lid not in file_based:
                 continue
             pub_src = layer.publicSource()
             if pub_src.startswith("GPKG:"):
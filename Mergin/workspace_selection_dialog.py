@@ -22,6 +22,13 @@ class WorkspacesModel(QAbstractListModel):
     def __init__(self, workspaces):
         super(WorkspacesModel, self).__init__()
         self.workspaces = workspaces
+        # data() is called for every visible row on each repaint, so tooltips are formatted only once
+        self.tooltips = [
+            "Workspace: {}\nDescription: {}\nProjects: {}".format(
+                workspace["name"], workspace["description"] or "", workspace["project_count"]
+            )
+            for workspace in workspaces
+        ]
 
     def rowCount(self, parent=None, *args, **kwargs):
         return len(self.workspaces)
@@ -31,10 +38,7 @@ class WorkspacesModel(QAbstractListModel):
         if role == Qt.UserRole:
             return workspace
         if role == Qt.ToolTipRole:
-            name = workspace["name"]
-            desc = workspace["description"] or ""
-            count = workspace["project_count"]
-            return "Workspace: {}\nDescription: {}\nProjects: {}".format(name, desc, count)
+            return self.tooltips[index.row()]
         return workspace["name"]
 
 